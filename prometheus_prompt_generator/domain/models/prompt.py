@@ -5,9 +5,12 @@ This module contains the Prompt class which represents a prompt entity
 in the application along with its validation rules and CRUD operations.
 """
 
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtProperty, pyqtSlot, QDateTime
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtProperty, pyqtSlot, QDateTime, QSignalBlocker, QTimer
 from PyQt6.QtSql import QSqlQuery, QSqlError
 
+# Delay after the last keystroke before PromptMapper copies edited text into the model
+_SYNC_INTERVAL_MS = 300
+
 class Prompt(QObject):
     """
     Represents an AI prompt in the Prometheus system.
@@ -141,7 +144,8 @@ class Prompt(QObject):
             bool: True if validation passes, False otherwise
         """
         # Title is required and must be between 3 and 100 characters
-        if not self._title or len(self._title) < 3 or len(self._title) > 100:
+        title_len = len(self._title) if self._title else 0
+        if not 3 <= title_len <= 100:
             self.error.emit(self.tr("Title must be between 3 and 100 characters"))
             return False
         
@@ -482,6 +486,19 @@ class PromptMapper:
         self.widgets = form_widgets
         self.connections = []
         
+        # Text fields edited since their text was last copied to the model.
+        # QTextEdit.toPlainText() serializes the whole document, so it is only
+        # called when the model is synced rather than on every keystroke.
+        self._dirty_text = set()
+        # Syncs the edited text once typing pauses
+        self._sync_timer = QTimer()
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(_SYNC_INTERVAL_MS)
+        self._sync_timer.timeout.connect(self.sync_model)
+        # True while the mapper itself is writing to the model, so the
+        # resulting changed signal is not echoed back into the widgets
+        self._writing = False
+        
         # Connect prompt signals
         self.prompt.changed.connect(self.update_widgets)
         self.prompt.error.connect(self.show_error)
@@ -495,64 +512,101 @@ class PromptMapper:
     def _connect_widgets(self):
         """Connect widget signals to update the model."""
         if 'title' in self.widgets:
+            # textEdited only fires for user edits, not for setText
             self.connections.append(
-                self.widgets['title'].textChanged.connect(
-                    lambda text: setattr(self.prompt, 'title', text)
+                self.widgets['title'].textEdited.connect(
+                    lambda text: self._mark_dirty('title')
                 )
             )
+            # Sync straight away when the field loses focus or Enter is pressed
+            self.connections.append(
+                self.widgets['title'].editingFinished.connect(self.sync_model)
+            )
         
         if 'content' in self.widgets:
             self.connections.append(
                 self.widgets['content'].textChanged.connect(
-                    lambda: setattr(self.prompt, 'content', self.widgets['content'].toPlainText())
+                    lambda: self._mark_dirty('content')
                 )
             )
         
         if 'description' in self.widgets:
             self.connections.append(
                 self.widgets['description'].textChanged.connect(
-                    lambda: setattr(self.prompt, 'description', self.widgets['description'].toPlainText())
+                    lambda: self._mark_dirty('description')
                 )
             )
         
         if 'is_public' in self.widgets:
             self.connections.append(
                 self.widgets['is_public'].toggled.connect(
-                    lambda checked: setattr(self.prompt, 'is_public', checked)
+                    lambda checked: self._write('is_public', checked)
                 )
             )
         
         if 'is_featured' in self.widgets:
             self.connections.append(
                 self.widgets['is_featured'].toggled.connect(
-                    lambda checked: setattr(self.prompt, 'is_featured', checked)
+                    lambda checked: self._write('is_featured', checked)
                 )
             )
         
         if 'is_custom' in self.widgets:
             self.connections.append(
                 self.widgets['is_custom'].toggled.connect(
-                    lambda checked: setattr(self.prompt, 'is_custom', checked)
+                    lambda checked: self._write('is_custom', checked)
                 )
             )
         
         if 'category' in self.widgets:
             self.connections.append(
                 self.widgets['category'].currentIndexChanged.connect(
-                    lambda index: setattr(self.prompt, 'category_id', 
-                                          self.widgets['category'].itemData(index))
+                    lambda index: self._write('category_id', 
+                                              self.widgets['category'].itemData(index))
                 )
             )
     
+    def _write(self, field, value):
+        """Set a model field from a widget without echoing it back to the form."""
+        self._writing = True
+        try:
+            setattr(self.prompt, field, value)
+        finally:
+            self._writing = False
+    
+    def _mark_dirty(self, field):
+        """Record an edited text field and restart the sync debounce."""
+        self._dirty_text.add(field)
+        self._sync_timer.start()
+    
+    def sync_model(self):
+        """Copy the text of edited text fields into the model."""
+        self._sync_timer.stop()
+        while self._dirty_text:
+            field = self._dirty_text.pop()
+            widget = self.widgets[field]
+            text = widget.text() if field == 'title' else widget.toPlainText()
+            self._write(field, text)
+    
     def update_widgets(self):
         """Update widget values from the model."""
-        if 'title' in self.widgets:
+        if self._writing:
+            # The form already shows this value
+            return
+        
+        # Keep the setters below from firing the widgets' change signals and
+        # writing the same values straight back; released when this returns
+        blockers = [QSignalBlocker(widget) for widget in self.widgets.values()]
+        
+        if 'title' in self.widgets and 'title' not in self._dirty_text:
             self.widgets['title'].setText(self.prompt.title)
         
-        if 'content' in self.widgets:
+        # Text fields with unsynced edits keep their text; the model is behind
+        # them, not ahead, and the edits reach it on the next sync
+        if 'content' in self.widgets and 'content' not in self._dirty_text:
             self.widgets['content'].setPlainText(self.prompt.content)
         
-        if 'description' in self.widgets:
+        if 'description' in self.widgets and 'description' not in self._dirty_text:
             self.widgets['description'].setPlainText(self.prompt.description)
         
         if 'is_public' in self.widgets:
@@ -583,6 +637,8 @@ class PromptMapper:
         if 'tags' in self.widgets:
             # Assuming this is a custom tag widget that can be updated with a list
             self.widgets['tags'].set_tags(self.prompt.tags)
+        
+        del blockers
     
     def show_error(self, error_message):
         """Show error message in the appropriate widget."""
@@ -597,10 +653,14 @@ class PromptMapper:
         Returns:
             bool: True if successful, False otherwise
         """
+        self.sync_model()
         return self.prompt.save()
     
     def reset(self):
         """Reset form to model values."""
+        # Discard unsynced text edits so the text fields are refilled too
+        self._sync_timer.stop()
+        self._dirty_text.clear()
         self.update_widgets()
         
         if 'error_label' in self.widgets:
@@ -608,6 +668,7 @@ class PromptMapper:
     
     def disconnect(self):
         """Disconnect all signal connections."""
+        self._sync_timer.stop()
         for connection in self.connections:
             try:
                 connection.disconnect()
@@ -0,0 +1,97 @@
+"""
+Unit tests for the PromptMapper in the Prometheus AI Prompt Generator.
+
+This module tests the binding between a Prompt model and its form widgets.
+The prompts are built in memory, so no database is needed; saving is
+patched out where a test submits the form.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from PyQt6.QtWidgets import QApplication, QLineEdit, QTextEdit
+from PyQt6.QtTest import QTest
+
+from prometheus_prompt_generator.domain.models import Prompt, PromptMapper
+
+
+class TestPromptMapper(unittest.TestCase):
+    """Test case for the PromptMapper form binding."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the QApplication the form widgets need."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Map an in-memory prompt onto fresh title/content/description widgets."""
+        self.prompt = Prompt()
+        self.prompt.title = "Test Prompt 1"
+        self.prompt.content = "Content for test prompt 1"
+        self.prompt.description = "A test prompt"
+
+        self.widgets = {
+            'title': QLineEdit(),
+            'content': QTextEdit(),
+            'description': QTextEdit(),
+        }
+        self.mapper = PromptMapper(self.prompt, self.widgets)
+
+    def tearDown(self):
+        """Disconnect the mapper from the prompt and widgets."""
+        self.mapper.disconnect()
+
+    def test_initial_values(self):
+        """Test the widgets are filled from the model."""
+        self.assertEqual(self.widgets['title'].text(), "Test Prompt 1")
+        self.assertEqual(self.widgets['content'].toPlainText(), "Content for test prompt 1")
+        self.assertEqual(self.widgets['description'].toPlainText(), "A test prompt")
+
+    def test_unsubmitted_text_survives_tag_change(self):
+        """Test typing, then changing the tags, then submitting keeps the typed text."""
+        # Type into the text edits without submitting
+        self.widgets['content'].setPlainText("Edited content")
+        self.widgets['description'].setPlainText("Edited description")
+
+        # Changing the tags emits changed, which refreshes the form
+        self.prompt.set_tags([{'id': 3, 'name': 'ai'}])
+
+        # The typed text must not be replaced by the model's old text
+        self.assertEqual(self.widgets['content'].toPlainText(), "Edited content")
+        self.assertEqual(self.widgets['description'].toPlainText(), "Edited description")
+
+        # Submitting copies the edits into the model before saving
+        with patch.object(Prompt, 'save', return_value=True) as save:
+            self.assertTrue(self.mapper.submit())
+        save.assert_called_once()
+        self.assertEqual(self.prompt.content, "Edited content")
+        self.assertEqual(self.prompt.description, "Edited description")
+        self.assertEqual(self.prompt.tags, [{'id': 3, 'name': 'ai'}])
+
+    def test_title_edits_sync_after_debounce(self):
+        """Test typed title text reaches the model only when the edits are synced."""
+        QTest.keyClicks(self.widgets['title'], " edited")
+
+        # Nothing is copied into the model on the keystrokes themselves
+        self.assertEqual(self.prompt.title, "Test Prompt 1")
+
+        # The debounce timer syncs the edit once typing pauses
+        QTest.qWait(500)
+        self.assertEqual(self.prompt.title, "Test Prompt 1 edited")
+
+    def test_model_change_updates_clean_fields(self):
+        """Test a model change still refreshes fields without pending edits."""
+        self.prompt.content = "Changed in the model"
+        self.assertEqual(self.widgets['content'].toPlainText(), "Changed in the model")
+
+    def test_reset_discards_unsubmitted_text(self):
+        """Test reset refills the text edits from the model."""
+        self.widgets['content'].setPlainText("Edited content")
+        self.mapper.reset()
+
+        self.assertEqual(self.widgets['content'].toPlainText(), "Content for test prompt 1")
+        self.assertEqual(self.prompt.content, "Content for test prompt 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
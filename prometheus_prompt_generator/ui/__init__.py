@@ -4,4 +4,6 @@ UI Components for the Prometheus AI Prompt Generator
 
 from .main_window import PrometheusPromptGenerator
 from .metadata_dialog import MetadataDialog
-from .prompt_list_item import PromptListItem 
\ No newline at end of file
+# Legacy per-row widget; the windows paint rows with PromptItemDelegate
+from .prompt_list_item import PromptListItem
+from .prompt_item_delegate import PromptItemDelegate 
\ No newline at end of file
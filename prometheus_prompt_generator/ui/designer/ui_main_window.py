@@ -51,6 +51,7 @@ class Ui_MainWindow(object):
         self.leftLayout.addLayout(self.selectButtonsLayout)
         self.promptList = QtWidgets.QListWidget(parent=self.leftWidget)
         self.promptList.setAlternatingRowColors(True)
+        self.promptList.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.MultiSelection)
         self.promptList.setObjectName("promptList")
         self.leftLayout.addWidget(self.promptList)
         self.addPromptButton = QtWidgets.QPushButton(parent=self.leftWidget)
@@ -97,7 +98,8 @@ class Ui_MainWindow(object):
         self.generatedPromptHeader.setFont(font)
         self.generatedPromptHeader.setObjectName("generatedPromptHeader")
         self.rightLayout.addWidget(self.generatedPromptHeader)
-        self.outputText = QtWidgets.QTextEdit(parent=self.rightWidget)
+        self.outputText = QtWidgets.QPlainTextEdit(parent=self.rightWidget)
+        self.outputText.setMaximumBlockCount(10000)
         self.outputText.setObjectName("outputText")
         self.rightLayout.addWidget(self.outputText)
         self.buttonRow = QtWidgets.QHBoxLayout()
@@ -5,15 +5,16 @@ This module provides a complete implementation of the PrometheusPromptGenerator
 using the Qt Designer UI file for layout while preserving all functionality.
 """
 
-import os
 import sys
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QListWidgetItem, QFontDialog, QColorDialog, 
     QFileDialog, QMessageBox, QMenu, QApplication
 )
-from PyQt6.QtGui import QFont, QAction, QColor, QIcon
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6 import uic
+from PyQt6.QtGui import QFont, QAction, QColor, QIcon, QPalette
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QSize, QThreadPool, QSignalBlocker, QItemSelection,
+    QItemSelectionModel
+)
 
 # Import components from the package
 from ..utils.constants import (
@@ -23,54 +24,121 @@ from ..utils.constants import (
 # Fixed imports - use the correct paths to the actual modules
 from ..utils.prompt_library import PromptLibrary
 from ..utils import utils
-from .prompt_list_item import PromptListItem
-from .metadata_dialog import MetadataDialog
+from .prompt_item_delegate import PromptItemDelegate, PROMPT_TYPE_ROLE
+# UI class compiled from designer/main_window.ui with pyuic6 at build time
+from .designer.ui_main_window import Ui_MainWindow
+
 
-# Determine the UI file path
-UI_DIR = os.path.join(os.path.dirname(__file__), 'designer')
-UI_FILE = os.path.join(UI_DIR, 'main_window.ui')
+# Separator placed between generated prompts in the output
+_SEPARATOR = "\n\n" + "-" * 60 + "\n\n"
 
-# Check if UI file exists, generate it if not
-if not os.path.exists(UI_FILE):
-    from scripts.generate_ui_file import generate_ui_file
-    generate_ui_file()
+# Urgency label text indexed by slider value, built once at import
+_URGENCY_STRINGS = tuple(
+    f"{URGENCY_LEVELS.get(value, 'Normal')} ({value}/10)" for value in range(11)
+)
 
-# Try to import the generated UI class
-try:
-    from .designer.ui_main_window import Ui_MainWindow
-    USE_INHERITANCE = True
-except ImportError:
-    # Fall back to direct loading if the UI class isn't available
-    USE_INHERITANCE = False
+# Fallback colors for any key a theme does not define
+_DEFAULT_COLORS = {
+    'background': '#2c2c2c',
+    'text': '#ffffff',
+    'menu_bg': '#333333',
+    'menu_text': '#ffffff',
+    'input_bg': '#3c3c3c',
+    'input_text': '#ffffff',
+    'button_bg': '#2980b9',
+    'button_text': '#ffffff',
+    'button_hover': '#3498db',
+    'button_pressed': '#1c5c8e',
+    'list_alt_bg': '#444444',
+    'accent': '#2980b9',
+    'accent_text': '#ffffff',
+    'border': '#555555',
+    'slider_bg': '#555555',
+    'statusbar_bg': '#333333',
+    'statusbar_text': '#ffffff',
+}
+
+# Palette roles paired with the theme color key that fills them
+_PALETTE_ROLES = (
+    (QPalette.ColorRole.Window, 'background'),
+    (QPalette.ColorRole.WindowText, 'text'),
+    (QPalette.ColorRole.Base, 'input_bg'),
+    (QPalette.ColorRole.AlternateBase, 'list_alt_bg'),
+    (QPalette.ColorRole.Text, 'input_text'),
+    (QPalette.ColorRole.Button, 'button_bg'),
+    (QPalette.ColorRole.ButtonText, 'button_text'),
+    (QPalette.ColorRole.Highlight, 'accent'),
+    (QPalette.ColorRole.HighlightedText, 'accent_text'),
+)
 
+# Structural stylesheet, filled from a theme's colors with str.format_map.
+# Colors that map onto a palette role are applied through QPalette; this only
+# covers what a palette cannot express (borders, padding, hover states and
+# sub-controls).
+_STYLESHEET_TEMPLATE = "".join((
+    "QMenuBar, QMenu {{ background-color: {menu_bg}; color: {menu_text}; }}\n",
+    "QMenuBar::item:selected, QMenu::item:selected {{ background-color: {accent}; }}\n",
+    "QLineEdit, QTextEdit, QPlainTextEdit {{ border: 1px solid {border}; padding: 4px; }}\n",
+    "QPushButton {{ background-color: {button_bg}; color: {button_text}; border: none; padding: 6px 12px; border-radius: 3px; }}\n",
+    "QPushButton:hover {{ background-color: {button_hover}; }}\n",
+    "QPushButton:pressed {{ background-color: {button_pressed}; }}\n",
+    "QListWidget {{ border: 1px solid {border}; }}\n",
+    "QSlider::handle:horizontal {{ background-color: {accent}; border-radius: 5px; width: 10px; margin: -4px 0; }}\n",
+    "QSlider::groove:horizontal {{ height: 6px; background-color: {slider_bg}; border-radius: 3px; }}\n",
+    "QStatusBar {{ background-color: {statusbar_bg}; color: {statusbar_text}; }}\n",
+))
 
-class DesignerPrometheusPromptGenerator(QMainWindow):
+# Theme colors with every fallback key filled in, merged once at import
+_THEME_COLORS = {
+    theme_name: {**_DEFAULT_COLORS, **DEFAULT_THEME_COLORS.get(theme_name, {})}
+    for theme_name in DEFAULT_THEMES
+}
+
+# Stylesheets keyed by theme name, built once at import; the text depends only on the theme
+_THEME_CACHE = {
+    theme_name: _STYLESHEET_TEMPLATE.format_map(colors)
+    for theme_name, colors in _THEME_COLORS.items()
+}
+
+
+class DesignerPrometheusPromptGenerator(QMainWindow, Ui_MainWindow):
     """Prometheus AI Application for generating prompts with different urgency levels.
     
-    This version uses the Qt Designer UI file for layout but preserves all functionality
-    of the original hand-coded application.
+    This version uses the Qt Designer UI file for layout, via the pre-compiled
+    Ui_MainWindow class, but preserves all functionality of the original
+    hand-coded application.
     """
     
-    resized = pyqtSignal()
+    libraryLoaded = pyqtSignal(object)  # The loaded PromptLibrary, or the Exception raised
     
     def __init__(self):
         """Initialize the Prometheus AI Prompt Generator application."""
         super().__init__()
         
-        # Initialize UI either via inheritance or direct loading
-        if USE_INHERITANCE and isinstance(self, Ui_MainWindow):
-            self.setupUi(self)
-        else:
-            # Direct loading approach
-            if os.path.exists(UI_FILE):
-                self.ui = uic.loadUi(UI_FILE, self)
-            else:
-                raise FileNotFoundError(f"UI file not found: {UI_FILE}")
+        # Build the widget tree from the pre-compiled UI class
+        self.setupUi(self)
         
         # Application state
-        self.selected_prompts = []
-        self.prompt_library = PromptLibrary()
+        self.selected_prompts = set()
+        self.prompt_library = None  # Loaded in the background, see _load_prompt_library
+        self._prompt_cache = {}  # Prompt data keyed by type, snapshot of the library
+        self._sorted_types = []  # Prompt types in display order
         self.current_theme = "Dark Blue"
+        self._applied_stylesheet = ""
+        self._theme_applied = False
+        self._last_accent = None
+        self._prompt_headers = {}
+        self._search_keys = []  # Lowercased "display name\0prompt type" per row
+        self._filter_text = ""  # Lowercased text of the filter currently applied
+        self._visible_rows = set()  # Rows the current filter leaves visible
+        self._metadata_dialog = None  # Created on first use, then reused
+        self._font_dialog = None  # Created on first use, then reused
+        
+        # Prompt rows are painted by a shared delegate rather than per-row widgets
+        self.prompt_delegate = PromptItemDelegate(self.promptList)
+        self.promptList.setItemDelegate(self.prompt_delegate)
+        # Every row has the same height, so the view can skip per-row size hints
+        self.promptList.setUniformItemSizes(True)
         
         # Initialize the UI further
         self.setup_connections()
@@ -78,55 +146,87 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
         self.apply_theme(self.current_theme)
         self.apply_font_settings()
         
-        # Populate the prompt list
+        # Load the prompt library off the GUI thread so the window paints
+        # first; the list is populated once the library arrives
+        self.libraryLoaded.connect(self._on_library_loaded)
+        self.show_loading_placeholder()
+        QThreadPool.globalInstance().start(self._load_prompt_library)
+    
+    def _load_prompt_library(self):
+        """Load the prompt library on a worker thread and hand it to the GUI thread."""
+        try:
+            result = PromptLibrary()
+        except Exception as e:
+            # Reported on the GUI thread; an exception raised here would be lost
+            result = e
+        
+        try:
+            self.libraryLoaded.emit(result)
+        except RuntimeError:
+            # The window was destroyed while the library was loading
+            pass
+    
+    @pyqtSlot(object)
+    def _on_library_loaded(self, prompt_library):
+        """Store the loaded prompt library and populate the prompt list."""
+        if isinstance(prompt_library, Exception):
+            self.show_loading_placeholder("Could not load prompts")
+            QMessageBox.critical(
+                self,
+                "Prompt Library Error",
+                f"Error loading the prompt library: {str(prompt_library)}"
+            )
+            return
+        
+        self.prompt_library = prompt_library
+        # Snapshot the prompts once so the list and generator read a plain dict
+        self._prompt_cache = {t: prompt_library.get(t, {}) for t in prompt_library.get_types()}
+        self._sorted_types = sorted(self._prompt_cache)
         self.populate_prompt_list()
     
+    def show_loading_placeholder(self, text="Loading prompts..."):
+        """Show a disabled placeholder row while the prompt library loads."""
+        self.promptList.clear()
+        item = QListWidgetItem(text)
+        item.setFlags(Qt.ItemFlag.NoItemFlags)
+        self.promptList.addItem(item)
+    
     def setup_connections(self):
         """Connect signals to slots for all interactive elements."""
-        # Access widgets via self or self.ui depending on approach
-        widgets = self if USE_INHERITANCE else self.ui
-        
         # Connect search input
-        widgets.searchInput.textChanged.connect(self.filter_prompts)
+        self.searchInput.textChanged.connect(self.filter_prompts)
         
         # Connect prompt list selection
-        widgets.promptList.itemClicked.connect(self.handle_item_selection)
+        self.promptList.itemSelectionChanged.connect(self.handle_item_selection)
+        self.prompt_delegate.info_clicked.connect(self.show_metadata_dialog)
         
         # Connect urgency slider
-        widgets.urgencySlider.valueChanged.connect(self.update_urgency_display)
+        self.urgencySlider.valueChanged.connect(self.update_urgency_display)
         
         # Connect buttons
-        widgets.selectAllButton.clicked.connect(self.select_all_prompts)
-        widgets.selectNoneButton.clicked.connect(self.select_no_prompts)
-        widgets.generatePromptsButton.clicked.connect(self.generate_prompts)
-        widgets.copyToClipboardButton.clicked.connect(self.copy_to_clipboard)
-        widgets.addPromptButton.clicked.connect(self.add_custom_prompt)
-        
-        # Connect resize events
-        self.resized.connect(self.handle_resize)
+        self.selectAllButton.clicked.connect(self.select_all_prompts)
+        self.selectNoneButton.clicked.connect(self.select_no_prompts)
+        self.generatePromptsButton.clicked.connect(self.generate_prompts)
+        self.copyToClipboardButton.clicked.connect(self.copy_to_clipboard)
+        self.addPromptButton.clicked.connect(self.add_custom_prompt)
     
     def setup_menus(self):
         """Setup application menus and connect actions."""
-        # Access widgets via self or self.ui depending on approach
-        widgets = self if USE_INHERITANCE else self.ui
-        
         # File menu actions
-        widgets.actionImport.triggered.connect(self.import_prompts)
-        widgets.actionExport.triggered.connect(self.export_prompts)
-        widgets.actionExit.triggered.connect(self.close)
+        self.actionImport.triggered.connect(self.import_prompts)
+        self.actionExport.triggered.connect(self.export_prompts)
+        self.actionExit.triggered.connect(self.close)
         
         # Edit menu actions
-        widgets.actionChangeFont.triggered.connect(self.change_font)
-        widgets.actionResetFont.triggered.connect(self.reset_font_to_default)
+        self.actionChangeFont.triggered.connect(self.change_font)
+        self.actionResetFont.triggered.connect(self.reset_font_to_default)
         
         # Theme menu actions
-        if hasattr(widgets, 'actionLightTheme'):
-            widgets.actionLightTheme.triggered.connect(lambda: self.apply_theme("Light"))
-        if hasattr(widgets, 'actionDarkTheme'):
-            widgets.actionDarkTheme.triggered.connect(lambda: self.apply_theme("Dark Blue"))
+        self.actionLightTheme.triggered.connect(self._apply_light_theme)
+        self.actionDarkTheme.triggered.connect(self._apply_dark_theme)
         
         # Help menu actions
-        widgets.actionAbout.triggered.connect(self.show_about)
+        self.actionAbout.triggered.connect(self.show_about)
     
     def apply_font_settings(self):
         """Apply font settings to all text widgets."""
@@ -137,201 +237,187 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
         # Create font object
         font = QFont(font_family, font_size)
         
-        # Apply to application
-        QApplication.setFont(font)
-        
-        # Apply to specific widgets that might need different styling
-        # Access widgets via self or self.ui depending on approach
-        widgets = self if USE_INHERITANCE else self.ui
+        # Apply to this window only, unless it already uses this font; child
+        # widgets inherit it without a re-polish of the whole application
+        if font != self.font():
+            self.setFont(font)
         
         # Headers with larger font size
         header_font = QFont(font_family, font_size + 2, QFont.Weight.Bold)
-        if hasattr(widgets, 'promptTypesHeader'):
-            widgets.promptTypesHeader.setFont(header_font)
-        if hasattr(widgets, 'urgencyHeader'):
-            widgets.urgencyHeader.setFont(header_font)
-        if hasattr(widgets, 'generatedPromptHeader'):
-            widgets.generatedPromptHeader.setFont(header_font)
+        self.promptTypesHeader.setFont(header_font)
+        self.urgencyHeader.setFont(header_font)
+        self.generatedPromptHeader.setFont(header_font)
     
     def apply_theme(self, theme_name):
         """Apply a theme to the application UI."""
         if theme_name not in DEFAULT_THEMES:
             theme_name = "Dark Blue"  # Default to Dark Blue if theme not found
         
+        # Nothing to do if this theme is already applied
+        if theme_name == self.current_theme and self._theme_applied:
+            return
+        
         # Set the current theme
         self.current_theme = theme_name
         
-        # Get colors for the selected theme
-        colors = DEFAULT_THEME_COLORS.get(theme_name, {})
-        
-        # Determine if this is a dark theme
-        is_dark = theme_name.startswith("Dark")
-        
-        # Create stylesheet
-        stylesheet = f"""
-        QMainWindow, QDialog {{ background-color: {colors.get('background', '#2c2c2c')}; color: {colors.get('text', '#ffffff')}; }}
-        QMenuBar, QMenu {{ background-color: {colors.get('menu_bg', '#333333')}; color: {colors.get('menu_text', '#ffffff')}; }}
-        QMenuBar::item:selected, QMenu::item:selected {{ background-color: {colors.get('accent', '#2980b9')}; }}
-        QLineEdit, QTextEdit {{ 
-            background-color: {colors.get('input_bg', '#3c3c3c')}; 
-            color: {colors.get('input_text', '#ffffff')}; 
-            border: 1px solid {colors.get('border', '#555555')}; 
-            padding: 4px;
-        }}
-        QPushButton {{ 
-            background-color: {colors.get('button_bg', '#2980b9')}; 
-            color: {colors.get('button_text', '#ffffff')}; 
-            border: none; 
-            padding: 6px 12px; 
-            border-radius: 3px;
-        }}
-        QPushButton:hover {{ background-color: {colors.get('button_hover', '#3498db')}; }}
-        QPushButton:pressed {{ background-color: {colors.get('button_pressed', '#1c5c8e')}; }}
-        QListWidget {{ 
-            background-color: {colors.get('list_bg', '#3c3c3c')}; 
-            color: {colors.get('list_text', '#ffffff')}; 
-            alternate-background-color: {colors.get('list_alt_bg', '#444444')};
-            border: 1px solid {colors.get('border', '#555555')}; 
-        }}
-        QListWidget::item:selected {{ 
-            background-color: {colors.get('accent', '#2980b9')}; 
-            color: {colors.get('accent_text', '#ffffff')}; 
-        }}
-        QSlider::handle:horizontal {{ 
-            background-color: {colors.get('accent', '#2980b9')}; 
-            border-radius: 5px; 
-            width: 10px; 
-            margin: -4px 0; 
-        }}
-        QSlider::groove:horizontal {{ 
-            height: 6px; 
-            background-color: {colors.get('slider_bg', '#555555')}; 
-            border-radius: 3px;
-        }}
-        QLabel {{ color: {colors.get('text', '#ffffff')}; }}
-        QMessageBox {{ background-color: {colors.get('background', '#2c2c2c')}; color: {colors.get('text', '#ffffff')}; }}
-        QLabel#sectionHeader {{ 
-            color: {colors.get('header_text', '#ffffff')}; 
-            font-weight: bold; 
-        }}
-        QStatusBar {{ 
-            background-color: {colors.get('statusbar_bg', '#333333')}; 
-            color: {colors.get('statusbar_text', '#ffffff')};
-        }}
-        """
+        # Get colors for the selected theme, with fallbacks already resolved
+        colors = _THEME_COLORS[theme_name]
+        
+        # Colors go through the palette; the stylesheet only carries structure
+        self._apply_palette(colors)
+        self._apply_structural_qss(theme_name)
+        
+        # Restyle the prompt rows only if their tag color changed; the
+        # delegate repaints them from model data
+        accent = colors['accent']
+        if accent != self._last_accent:
+            self._last_accent = accent
+            self.prompt_delegate.setAccentColor(accent)
+            self.promptList.viewport().update()
         
-        # Apply stylesheet
-        self.setStyleSheet(stylesheet)
+        self._theme_applied = True
+    
+    @pyqtSlot()
+    def _apply_light_theme(self):
+        """Apply the Light theme from the Theme menu."""
+        self.apply_theme("Light")
+    
+    @pyqtSlot()
+    def _apply_dark_theme(self):
+        """Apply the Dark Blue theme from the Theme menu."""
+        self.apply_theme("Dark Blue")
+    
+    def _apply_palette(self, colors):
+        """Apply the palette-expressible theme colors to the application.
+        
+        The palette is set on the application rather than the window so
+        top-level dialogs (message boxes, metadata and font dialogs), which do
+        not inherit a window's palette, get the theme colors too.
+        """
+        palette = QApplication.palette()
+        for role, key in _PALETTE_ROLES:
+            palette.setColor(role, QColor(colors[key]))
+        QApplication.setPalette(palette)
+    
+    def _apply_structural_qss(self, theme_name):
+        """Apply the structural stylesheet, skipping the re-polish if it is unchanged."""
+        stylesheet = _THEME_CACHE[theme_name]
         
-        # Apply to all existing prompt list items
-        for i in range(self.promptList.count()):
-            item = self.promptList.item(i)
-            widget = self.promptList.itemWidget(item)
-            if isinstance(widget, PromptListItem):
-                widget.updateStyle(is_dark, colors.get('accent', '#2980b9'))
+        if stylesheet != self._applied_stylesheet:
+            self._applied_stylesheet = stylesheet
+            self.setStyleSheet(stylesheet)
     
     def populate_prompt_list(self):
         """Populate the prompt list with available prompt types."""
         # First clear any existing items
         self.promptList.clear()
-        self.selected_prompts = []  # Reset selected prompts when repopulating
-        
-        # Get all prompt types from the prompt library
-        prompt_types = self.prompt_library.get_types()
-        
-        # Sort prompt types alphabetically for a better UI experience
-        prompt_types.sort()
-        
-        # Add each prompt type to the list
-        for prompt_type in prompt_types:
-            # Get display name and info for this prompt type
-            prompt_info = self.prompt_library.get(prompt_type, {})
-            display_name = prompt_info.get("title", prompt_type)
-            
-            # Create list item
-            item = QListWidgetItem()
-            self.promptList.addItem(item)
-            
-            # Create custom widget for this item
-            item_widget = PromptListItem(
-                prompt_type=prompt_type,  # The exact key from the prompt library
-                display_name=display_name,
-                show_info_icon=True
-            )
-            
-            # Connect the info button to show metadata
-            item_widget.info_clicked.connect(self.show_metadata_dialog)
-            
-            # Set the item widget for this list item
-            self.promptList.setItemWidget(item, item_widget)
-            
-        # Update the UI to reflect the current selection state
-        self.update_selection_display()
+        self.selected_prompts.clear()  # Reset selected prompts when repopulating
+        self._prompt_headers = {}  # Output headers, built once per prompt type
+        self._search_keys = []  # Search keys, lowercased once per prompt type
+        self._filter_text = ""
+        
+        # Prompt types, already sorted alphabetically when the library loaded
+        prompt_types = self._sorted_types
+        
+        promptList = self.promptList
+        get_prompt = self._prompt_cache.get
+        headers = self._prompt_headers
+        search_keys = self._search_keys
+        
+        # Add each prompt type to the list without per-row signals, sorting
+        # or repaints; the list is laid out and painted once at the end
+        sorting_enabled = promptList.isSortingEnabled()
+        promptList.setSortingEnabled(False)
+        promptList.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(promptList):
+                for prompt_type in prompt_types:
+                    # Get display name and info for this prompt type
+                    prompt_info = get_prompt(prompt_type, {})
+                    display_name = prompt_info.get("title") or prompt_type
+                    headers[prompt_type] = f"### {display_name} ###\n\n"
+                    
+                    # Create list item; the delegate paints it from the item data
+                    item = QListWidgetItem(display_name)
+                    item.setData(PROMPT_TYPE_ROLE, prompt_type)  # The exact key from the prompt library
+                    promptList.addItem(item)
+                    search_keys.append(f"{display_name.lower()}\0{prompt_type.lower()}")
+        finally:
+            promptList.setUpdatesEnabled(True)
+            promptList.setSortingEnabled(sorting_enabled)
+            promptList.viewport().update()
+        
+        # Every new row starts visible; re-apply any search already typed
+        self._visible_rows = set(range(len(search_keys)))
+        self.filter_prompts(self.searchInput.text())
     
+    @pyqtSlot(str)
     def show_metadata_dialog(self, prompt_type):
         """Show the metadata dialog for a prompt type."""
         # Get prompt information
-        prompt_info = self.prompt_library.get(prompt_type, {})
+        prompt_info = self._prompt_cache.get(prompt_type, {})
         if not prompt_info:
             return
         
-        # Create and show dialog
-        dialog = MetadataDialog(prompt_type, prompt_info, parent=self)
-        dialog.exec()
+        # Build the dialog on first use and reuse it afterwards
+        if self._metadata_dialog is None:
+            # Imported here so startup doesn't pay for the dialog module
+            from .metadata_dialog import MetadataDialog
+            self._metadata_dialog = MetadataDialog(parent=self)
+        
+        # Load the prompt and show the dialog
+        self._metadata_dialog.set_prompt(prompt_type, prompt_info)
+        self._metadata_dialog.exec()
     
+    @pyqtSlot(int)
     def update_urgency_display(self, value):
         """Update the urgency display with the current slider value."""
-        # Get urgency level text from the value
-        urgency_text = URGENCY_LEVELS.get(value, "Normal")
-        
-        # Update the label
-        self.urgencyDisplay.setText(f"{urgency_text} ({value}/10)")
-    
-    def handle_item_selection(self, item):
-        """Handle selection of an item in the prompt list."""
-        # Get the widget to access the prompt type
-        item_widget = self.promptList.itemWidget(item)
-        if not item_widget:
-            return
-            
-        prompt_type = item_widget.prompt_type
-        
-        # Toggle selection state
-        if prompt_type in self.selected_prompts:
-            self.selected_prompts.remove(prompt_type)
-        else:
-            self.selected_prompts.append(prompt_type)
-        
-        # Update the UI to reflect the selection state
-        self.update_selection_display()
-    
-    def handle_resize(self):
-        """Handle window resize events."""
-        # Adjust UI elements if needed on resize
-        pass
+        # Label text is precomputed for every slider value
+        self.urgencyDisplay.setText(_URGENCY_STRINGS[value])
     
-    def resizeEvent(self, event):
-        """Override resize event to emit signal."""
-        super().resizeEvent(event)
-        self.resized.emit()
+    @pyqtSlot()
+    def handle_item_selection(self):
+        """Handle a change of selection in the prompt list."""
+        # The list toggles rows itself (multi-selection), so just read back
+        # the selected items instead of rescanning every row
+        selected = self.selected_prompts
+        selected.clear()
+        for item in self.promptList.selectedItems():
+            prompt_type = item.data(PROMPT_TYPE_ROLE)
+            if prompt_type:
+                selected.add(prompt_type)
     
+    @pyqtSlot()
     def select_all_prompts(self):
-        """Select all prompt types in the list."""
-        self.selected_prompts = []
-        for i in range(self.promptList.count()):
-            item = self.promptList.item(i)
-            item_widget = self.promptList.itemWidget(item)
-            if item_widget:
-                self.selected_prompts.append(item_widget.prompt_type)
-        
-        # Update UI to reflect selection state
-        self.update_selection_display()
+        """Select all prompt types in the list, or only the visible ones while filtering."""
+        promptList = self.promptList
+        if not self._filter_text:
+            # One selection change; handle_item_selection picks up the new set
+            promptList.selectAll()
+            return
+        
+        # Hidden rows must stay out of the selection, so select each run of
+        # consecutive visible rows as one range in a single selection change
+        model = promptList.model()
+        selection = QItemSelection()
+        start = previous = None
+        for row in sorted(self._visible_rows):
+            if start is None:
+                start = row
+            elif row != previous + 1:
+                selection.select(model.index(start, 0), model.index(previous, 0))
+                start = row
+            previous = row
+        if start is not None:
+            selection.select(model.index(start, 0), model.index(previous, 0))
+        promptList.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select)
     
+    @pyqtSlot()
     def select_no_prompts(self):
         """Deselect all prompt types in the list."""
-        self.selected_prompts = []
-        self.update_selection_display()
+        self.promptList.clearSelection()
     
+    @pyqtSlot()
     def generate_prompts(self):
         """Generate prompts based on selected types and urgency level."""
         # Check if any prompts are selected
@@ -353,13 +439,14 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
         errors = []
         generated_count = 0
         
-        # Generate prompts
-        generated_texts = []
-        
-        for prompt_type in self.selected_prompts:
+        # Collect the templates to generate
+        # Selection is unordered, so emit prompts in a stable alphabetical order
+        headers = []
+        templates = []
+        for prompt_type in sorted(self.selected_prompts):
             try:
                 # Get prompt template
-                prompt_data = self.prompt_library.get(prompt_type)
+                prompt_data = self._prompt_cache.get(prompt_type)
                 
                 if not prompt_data:
                     errors.append(f"Prompt type '{prompt_type}' not found in library")
@@ -371,40 +458,50 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
                     errors.append(f"Template for '{prompt_type}' is empty")
                     continue
                 
-                # Generate with urgency applied
-                prompt_text = utils.generate_template_with_urgency(template, urgency_level)
-                
-                # Add to results with prompt type as header
-                formatted_prompt = f"### {prompt_data.get('title', prompt_type)} ###\n\n{prompt_text}"
-                generated_texts.append(formatted_prompt)
-                generated_count += 1
+                # Use prompt type as header
+                header = self._prompt_headers.get(prompt_type)
+                if header is None:
+                    header = f"### {prompt_data.get('title') or prompt_type} ###\n\n"
+                headers.append(header)
+                templates.append(template)
                 
             except Exception as e:
                 errors.append(f"Error generating '{prompt_type}': {str(e)}")
         
-        # If we generated at least one prompt, show it
-        if generated_texts:
-            # Join all prompts with separator
-            separator = "\n\n" + "-" * 60 + "\n\n"
-            all_prompts = separator.join(generated_texts)
-            
-            # Set the output text
-            self.outputText.setText(all_prompts)
-            
+        # Generate with urgency applied, looking up the urgency modifiers once
+        try:
+            prompt_texts = utils.generate_templates_with_urgency(templates, urgency_level)
+        except Exception as e:
+            errors.append(f"Error applying urgency level {urgency_level}: {str(e)}")
+            prompt_texts = []
+        
+        # Stream prompts straight into the document; the edit block batches
+        # the layout and repaint into a single update
+        cursor = self.outputText.textCursor()
+        cursor.beginEditBlock()
+        for header, prompt_text in zip(headers, prompt_texts):
+            if generated_count:
+                cursor.insertText(_SEPARATOR)
+            cursor.insertText(header + prompt_text)
+            generated_count += 1
+        cursor.endEditBlock()
+        
+        # If we generated at least one prompt, report it
+        if generated_count:
             # Update status bar
-            if hasattr(self, 'statusbar'):
-                self.statusbar.showMessage(
-                    f"Generated {generated_count} prompt(s) with urgency level {urgency_level}/10", 
-                    3000
-                )
+            self.statusbar.showMessage(
+                f"Generated {generated_count} prompt(s) with urgency level {urgency_level}/10", 
+                3000
+            )
         else:
-            self.outputText.setText("No prompts could be generated. Please check the error message.")
+            self.outputText.setPlainText("No prompts could be generated. Please check the error message.")
         
         # If there were errors, show a single error dialog with all issues
         if errors:
             error_message = "The following errors occurred:\n\n" + "\n".join(f"• {error}" for error in errors)
             QMessageBox.warning(self, "Prompt Generation Issues", error_message)
     
+    @pyqtSlot()
     def copy_to_clipboard(self):
         """Copy the generated prompt to the clipboard."""
         text = self.outputText.toPlainText()
@@ -412,30 +509,44 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
             clipboard = QApplication.clipboard()
             clipboard.setText(text)
             
-            # Show confirmation in status bar if available
-            if hasattr(self, 'statusbar'):
-                self.statusbar.showMessage("Copied to clipboard", 2000)
+            # Show confirmation in status bar
+            self.statusbar.showMessage("Copied to clipboard", 2000)
     
+    @pyqtSlot(str)
     def filter_prompts(self, text):
         """Filter the prompt list based on search text."""
-        # If text is empty, show all prompts
-        if not text:
-            for i in range(self.promptList.count()):
-                self.promptList.item(i).setHidden(False)
+        needle = text.lower()
+        if needle == self._filter_text:
             return
         
-        # Otherwise, filter based on text
-        text = text.lower()
-        for i in range(self.promptList.count()):
-            item = self.promptList.item(i)
-            widget = self.promptList.itemWidget(item)
-            if widget:
-                display_name = widget.display_name.lower()
-                prompt_type = widget.prompt_type.lower()
-                
-                # Show if text is in display name or prompt type
-                item.setHidden(text not in display_name and text not in prompt_type)
+        # Match against the search keys lowercased at populate time; rows and
+        # keys share the same order. An empty needle matches every row. When
+        # the text only grows (the usual case while typing), rows already
+        # hidden cannot match, so only the visible rows are re-checked.
+        search_keys = self._search_keys
+        old_visible = self._visible_rows
+        if self._filter_text in needle:
+            candidates = old_visible
+        else:
+            candidates = range(len(search_keys))
+        visible = {i for i in candidates if needle in search_keys[i]}
+        
+        # Only touch rows whose visibility actually changes, and repaint once
+        promptList = self.promptList
+        item_at = promptList.item
+        promptList.setUpdatesEnabled(False)
+        try:
+            for i in old_visible - visible:
+                item_at(i).setHidden(True)
+            for i in visible - old_visible:
+                item_at(i).setHidden(False)
+        finally:
+            promptList.setUpdatesEnabled(True)
+        
+        self._filter_text = needle
+        self._visible_rows = visible
     
+    @pyqtSlot()
     def add_custom_prompt(self):
         """Add a custom prompt to the library."""
         # Display an informational message for now
@@ -445,6 +556,7 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
             "This feature is not yet implemented."
         )
     
+    @pyqtSlot()
     def import_prompts(self):
         """Import prompts from a file."""
         # Display an informational message for now
@@ -454,6 +566,7 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
             "This feature is not yet implemented."
         )
     
+    @pyqtSlot()
     def export_prompts(self):
         """Export prompts to a file."""
         # Display an informational message for now
@@ -463,18 +576,30 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
             "This feature is not yet implemented."
         )
     
+    @pyqtSlot()
     def change_font(self):
-        """Change the application font."""
-        current_font = QApplication.font()
-        font, ok = QFontDialog.getFont(current_font, self)
-        if ok:
-            QApplication.setFont(font)
+        """Change the window font."""
+        # Keep one dialog so the installed font families are enumerated once,
+        # not every time the dialog opens
+        if self._font_dialog is None:
+            self._font_dialog = QFontDialog(self)
+        dialog = self._font_dialog
+        
+        current_font = self.font()
+        dialog.setCurrentFont(current_font)
+        if dialog.exec():
+            font = dialog.selectedFont()
+            if font != current_font:
+                self.setFont(font)
     
+    @pyqtSlot()
     def reset_font_to_default(self):
         """Reset the font to the default."""
         font = QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE)
-        QApplication.setFont(font)
+        if font != self.font():
+            self.setFont(font)
     
+    @pyqtSlot()
     def show_about(self):
         """Show the about dialog."""
         QMessageBox.about(
@@ -487,37 +612,8 @@ class DesignerPrometheusPromptGenerator(QMainWindow):
             "<p>© 2025 Prometheus AI</p>"
         )
 
-    def update_selection_display(self):
-        """Update the UI to reflect the current selection state."""
-        for i in range(self.promptList.count()):
-            item = self.promptList.item(i)
-            item_widget = self.promptList.itemWidget(item)
-            
-            if item_widget and item_widget.prompt_type in self.selected_prompts:
-                item.setSelected(True)
-            else:
-                item.setSelected(False)
-
-
-# Create a version that uses inheritance if UI class is available
-if USE_INHERITANCE:
-    class DesignerPrometheusPromptGeneratorInheritance(DesignerPrometheusPromptGenerator, Ui_MainWindow):
-        """Version of PrometheusPromptGenerator that uses multiple inheritance with the UI class."""
-        
-        def __init__(self):
-            """Initialize the application using multiple inheritance."""
-            super().__init__()
-            
-            # Note: setupUi is called in the parent class's __init__
-            
-            # Additional initialization if needed
-            pass
-
 
-# Function to get the appropriate class based on availability
+# Function to get the main window class, kept for the application entry points
 def get_designer_main_window_class():
-    """Return the appropriate designer main window class based on UI availability."""
-    if USE_INHERITANCE:
-        return DesignerPrometheusPromptGeneratorInheritance
-    else:
-        return DesignerPrometheusPromptGenerator 
\ No newline at end of file
+    """Return the designer main window class."""
+    return DesignerPrometheusPromptGenerator
@@ -7,13 +7,16 @@ The main window of the Prometheus AI Prompt Generator application.
 import os
 import sys
 import random
-import json
+import copy
+from bisect import bisect_left
+from functools import lru_cache, partial
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QLabel, QListWidget, QSlider, QPushButton, QTextEdit, 
                            QSplitter, QFrame, QAbstractItemView, QStatusBar, 
                            QMessageBox, QInputDialog, QDialog, QFileDialog, QMenu, QMenuBar, QLineEdit, QListWidgetItem,
-                           QDialogButtonBox, QFormLayout, QGridLayout, QToolButton, QFontDialog, QComboBox, QSizePolicy)
-from PyQt6.QtCore import Qt, QSettings, QSize, pyqtSignal
+                           QDialogButtonBox, QFormLayout, QGridLayout, QToolButton, QFontDialog, QComboBox, QSizePolicy,
+                           QApplication, QStyle)
+from PyQt6.QtCore import Qt, QSettings, QSize, QTimer, QSignalBlocker, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPixmap, QAction, QActionGroup
 
 # Import qt-material for improved theming
@@ -21,29 +24,62 @@ from qt_material import apply_stylesheet
 
 # Import our modules
 from ..utils.constants import (DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE, DEFAULT_HEADING_SIZE,
-                              PROMETHEUS_BLUE, PROMETHEUS_LIGHT_BLUE, PROMETHEUS_DARK, 
-                              PROMETHEUS_LIGHT, PROMETHEUS_ACCENT, AVAILABLE_THEMES, URGENCY_LEVELS)
+                              AVAILABLE_THEMES, DARK_THEMES, LIGHT_THEMES, URGENCY_LEVELS)
 from ..utils.prompt_library import PromptLibrary
-from ..utils import utils
-from .prompt_list_item import PromptListItem
+from ..utils import utils, json_dumps, json_loads
+from .prompt_item_delegate import PromptItemDelegate, PROMPT_TYPE_ROLE
 from .metadata_dialog import MetadataDialog
 
+# Settings read at startup, with the value used when a key is not stored yet
+_SETTINGS_DEFAULTS = {
+    "font_family": DEFAULT_FONT_FAMILY,
+    "font_size": DEFAULT_FONT_SIZE,
+    "theme": "Dark Blue",
+}
+
+# Separator placed between generated prompts in the output
+_SEPARATOR = "\n\n" + "-" * 40 + "\n\n"
+
+@lru_cache(maxsize=None)
+def _search_icon():
+    """Return the search field icon, looked up from the application style once"""
+    return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView)
+
 class PrometheusPromptGenerator(QMainWindow):
     """Prometheus AI Application for generating prompts with different urgency levels"""
     
     resized = pyqtSignal()
+    promptsExported = pyqtSignal(object)  # (file_path, count), or the Exception raised
+    promptsImported = pyqtSignal(object)  # Parsed file contents, or the Exception raised
     
     def __init__(self):
         """Initialize the application"""
         super().__init__()
         
-        # Setup settings
+        # Import/export file I/O runs on worker threads and reports back here
+        self.promptsExported.connect(self._onPromptsExported)
+        self.promptsImported.connect(self._onPromptsImported)
+        
+        # Coalesce resize events so resized fires once a drag settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self.resized.emit)
+        
+        # Setup settings, reading every key once into an in-memory mirror
         self.settings = QSettings("PrometheusAI", "PromptGenerator")
-        self.font_family = self.settings.value("font_family", DEFAULT_FONT_FAMILY)
-        self.font_size = int(self.settings.value("font_size", DEFAULT_FONT_SIZE))
+        self._settings_cache = {
+            key: self.settings.value(key, default) for key, default in _SETTINGS_DEFAULTS.items()
+        }
+        self._settings_cache["font_size"] = int(self._settings_cache["font_size"])
+        self.font_family = self._settings_cache["font_family"]
+        self.font_size = self._settings_cache["font_size"]
+        self._font_key = None  # (family, size) the cached fonts were built for
         
         # Initialize theme attribute to prevent AttributeError
-        self.current_theme = self.settings.value("theme", "Dark Blue")
+        self.current_theme = self._settings_cache["theme"]
+        self._last_primary_color = None
+        self._theme_applied = False  # True once this window has applied a theme
         
         # Set window title and geometry
         self.setWindowTitle("Prometheus AI Prompt Generator")
@@ -72,6 +108,10 @@ class PrometheusPromptGenerator(QMainWindow):
         """Initialize the user interface"""
         self.app = self.get_app_instance()
         
+        # Widgets restyled by applyFontSettings, tracked as they are created
+        self._heading_labels = []
+        self._base_font_widgets = []
+        
         # Create main widget and layout
         main_widget = QWidget()
         main_layout = QHBoxLayout(main_widget)
@@ -108,6 +148,7 @@ class PrometheusPromptGenerator(QMainWindow):
         prompt_types_header.setObjectName("sectionHeader")
         prompt_types_header.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE + 2, QFont.Weight.Bold))
         left_layout.addWidget(prompt_types_header)
+        self._heading_labels.append(prompt_types_header)
         
         # Search input with proper styling
         search_layout = QHBoxLayout()
@@ -116,11 +157,16 @@ class PrometheusPromptGenerator(QMainWindow):
         self.filter_input = QLineEdit()
         self.filter_input.setObjectName("searchInput")
         self.filter_input.setPlaceholderText("Search prompt types...")
-        self.filter_input.textChanged.connect(self.filterPrompts)
+        
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.applyFilter)
+        self.filter_input.textChanged.connect(self.scheduleFilter)
         
         # Use standard Qt icon for search - this is the modern approach
-        search_icon = self.style().standardIcon(self.style().StandardPixmap.SP_FileDialogContentsView)
-        self.filter_input.addAction(search_icon, QLineEdit.ActionPosition.LeadingPosition)
+        self.filter_input.addAction(_search_icon(), QLineEdit.ActionPosition.LeadingPosition)
         
         search_layout.addWidget(self.filter_input)
         left_layout.addLayout(search_layout)
@@ -142,7 +188,12 @@ class PrometheusPromptGenerator(QMainWindow):
         self.prompt_list.setObjectName("promptList")
         self.prompt_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.prompt_list.setAlternatingRowColors(True)
-        self.prompt_list.itemClicked.connect(self.handleItemSelection)
+        
+        # Rows are painted by a shared delegate rather than per-row widgets
+        self.prompt_delegate = PromptItemDelegate(self.prompt_list)
+        self.prompt_delegate.info_clicked.connect(self.showMetadataDialog)
+        self.prompt_list.setItemDelegate(self.prompt_delegate)
+        self.prompt_list.setUniformItemSizes(True)
         left_layout.addWidget(self.prompt_list)
         
         # Add new prompt button
@@ -156,6 +207,7 @@ class PrometheusPromptGenerator(QMainWindow):
         urgency_header.setObjectName("sectionHeader")
         urgency_header.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE + 2, QFont.Weight.Bold))
         right_layout.addWidget(urgency_header)
+        self._heading_labels.append(urgency_header)
         
         # Urgency slider with labels
         urgency_layout = QVBoxLayout()
@@ -166,12 +218,14 @@ class PrometheusPromptGenerator(QMainWindow):
         self.urgency_display.setObjectName("urgencyDisplay")
         self.urgency_display.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE, QFont.Weight.Bold))
         urgency_layout.addWidget(self.urgency_display)
+        self._base_font_widgets.append(self.urgency_display)
         
         # Slider with min, max labels
         slider_row = QHBoxLayout()
         min_label = QLabel("Low")
         min_label.setObjectName("minLabel")
         slider_row.addWidget(min_label)
+        self._base_font_widgets.append(min_label)
         
         self.urgency_slider = QSlider(Qt.Orientation.Horizontal)
         self.urgency_slider.setMinimum(1)
@@ -186,6 +240,7 @@ class PrometheusPromptGenerator(QMainWindow):
         max_label = QLabel("Extreme")
         max_label.setObjectName("maxLabel")
         slider_row.addWidget(max_label)
+        self._base_font_widgets.append(max_label)
         
         urgency_layout.addLayout(slider_row)
         right_layout.addLayout(urgency_layout)
@@ -195,6 +250,7 @@ class PrometheusPromptGenerator(QMainWindow):
         generated_header.setObjectName("sectionHeader")
         generated_header.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE + 2, QFont.Weight.Bold))
         right_layout.addWidget(generated_header)
+        self._heading_labels.append(generated_header)
         
         # Output area
         self.output_text = QTextEdit()
@@ -202,6 +258,7 @@ class PrometheusPromptGenerator(QMainWindow):
         self.output_text.setReadOnly(False)
         self.output_text.setPlaceholderText("The generated prompt will appear here. You can edit it as needed.")
         right_layout.addWidget(self.output_text)
+        self._base_font_widgets.append(self.output_text)
         
         # Create a button row for actions
         button_row = QHBoxLayout()
@@ -236,6 +293,12 @@ class PrometheusPromptGenerator(QMainWindow):
         # Connect resize signal
         self.resized.connect(self.handleResize)
         
+    def saveSetting(self, key, value):
+        """Store a setting, writing to the settings backend only if the value changed"""
+        if self._settings_cache.get(key) != value:
+            self._settings_cache[key] = value
+            self.settings.setValue(key, value)
+        
     def get_app_instance(self):
         """Get the QApplication instance"""
         from PyQt6.QtWidgets import QApplication
@@ -243,23 +306,23 @@ class PrometheusPromptGenerator(QMainWindow):
         
     def applyFontSettings(self):
         """Apply font settings to all widgets"""
-        # Create the base font
-        base_font = QFont(self.font_family, self.font_size)
+        # Build the base and heading fonts only when the family or size changed
+        font_key = (self.font_family, self.font_size)
+        if font_key != self._font_key:
+            self._font_key = font_key
+            self._base_font = QFont(self.font_family, self.font_size)
+            self._heading_font = QFont(self.font_family, DEFAULT_HEADING_SIZE, QFont.Weight.Bold)
+        base_font = self._base_font
+        heading_font = self._heading_font
         
         # Apply to application
         self.app.setFont(base_font)
         
-        # Apply to specific widgets (overriding as needed)
-        heading_font = QFont(self.font_family, DEFAULT_HEADING_SIZE, QFont.Weight.Bold)
-        
-        for widget in self.findChildren(QLabel):
-            if widget.objectName() == "sectionHeader":
-                widget.setFont(heading_font)
-            else:
-                widget.setFont(base_font)
+        # Apply to the tracked widgets (overriding as needed)
+        for widget in self._heading_labels:
+            widget.setFont(heading_font)
         
-        # Apply to text editing widgets
-        for widget in self.findChildren(QTextEdit):
+        for widget in self._base_font_widgets:
             widget.setFont(base_font)
         
         # Refresh status bar
@@ -267,28 +330,36 @@ class PrometheusPromptGenerator(QMainWindow):
         
     def applyTheme(self, theme_name):
         """Apply a theme to the application"""
+        # Nothing to do if this theme is already active
+        if theme_name == self.current_theme and self._theme_applied:
+            self.statusBar().showMessage(f"Theme {theme_name} is already active", 3000)
+            return
+        
         # Store theme name for reference
         self.current_theme = theme_name
         
         # Save theme setting
-        self.settings.setValue("theme", theme_name)
-        
-        # Check if it's a dark or light theme
-        is_dark = utils.is_dark_theme(theme_name)
+        self.saveSetting("theme", theme_name)
         
         # Apply the theme using qt-material
         if theme_name in AVAILABLE_THEMES:
+            # Always let qt-material render the theme: besides the stylesheet it
+            # regenerates the theme-colored icons the stylesheet points at and
+            # sets the application style, so a cached stylesheet would show the
+            # icons of whichever theme was rendered last
             apply_stylesheet(self.app, theme=AVAILABLE_THEMES[theme_name])
             
             # Get the primary color from the theme
             primary_color = utils.get_theme_color(theme_name)
             
-            # Apply theme colors to custom widgets
-            for item_idx in range(self.prompt_list.count()):
-                item = self.prompt_list.item(item_idx)
-                widget = self.prompt_list.itemWidget(item)
-                if isinstance(widget, PromptListItem):
-                    widget.updateStyle(is_dark, primary_color)
+            # Recolor the type tags only if the color changed; the delegate
+            # repaints rows from model data
+            if primary_color != self._last_primary_color:
+                self._last_primary_color = primary_color
+                self.prompt_delegate.setAccentColor(primary_color)
+                self.prompt_list.viewport().update()
+            
+            self._theme_applied = True
             
             # Set status bar message to confirm theme change
             self.statusBar().showMessage(f"Theme changed to {theme_name}", 3000)
@@ -298,61 +369,71 @@ class PrometheusPromptGenerator(QMainWindow):
             
     def populatePromptList(self):
         """Populate the list of available prompt types"""
-        # Clear the list first
-        self.prompt_list.clear()
-        
-        # Get all prompt types
-        prompt_types = self.prompt_library.get_types()
+        prompt_list = self.prompt_list
         
-        # Add each prompt type to the list with a custom widget
-        for prompt_type in sorted(prompt_types):
-            # Get prompt info
+        # Rebuild the list without per-row signals, sorting or repaints; it
+        # is laid out and painted once at the end
+        sorting_enabled = prompt_list.isSortingEnabled()
+        prompt_list.setSortingEnabled(False)
+        prompt_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(prompt_list):
+                # Clear the list first
+                prompt_list.clear()
+                
+                # Display names keyed by prompt type, and per-row state in row order
+                self._display_names = self.getDisplayNames()
+                self._row_types = sorted(self._display_names)
+                self._search_keys = []  # Lowercased "prompt type\0display name" per row
+                
+                # Add each prompt type to the list; the delegate paints it from the item data
+                for prompt_type in self._row_types:
+                    display_name = self._display_names[prompt_type]
+                    prompt_list.addItem(self._createPromptItem(prompt_type, display_name))
+                    self._search_keys.append(self._searchKey(prompt_type, display_name))
+        finally:
+            prompt_list.setUpdatesEnabled(True)
+            prompt_list.setSortingEnabled(sorting_enabled)
+            prompt_list.viewport().update()
+        
+    def getDisplayNames(self):
+        """Return the display name of every prompt type in the library"""
+        display_names = {}
+        for prompt_type in self.prompt_library.get_types():
             prompt_info = self.prompt_library.get(prompt_type, {})
-            display_name = prompt_info.get("title", utils.format_display_name(prompt_type))
-            
-            # Create list item
-            item = QListWidgetItem(self.prompt_list)
-            
-            # Create and set custom widget with info icon
-            widget = PromptListItem(prompt_type, display_name, parent=self.prompt_list, show_info_icon=True)
-            
-            # Connect signals
-            widget.clicked.connect(self.handleItemSelection)
-            widget.info_clicked.connect(self.showMetadataDialog)
-            
-            # Set item size to match widget
-            item.setSizeHint(widget.sizeHint())
-            
-            # Set widget for the item
-            self.prompt_list.addItem(item)
-            self.prompt_list.setItemWidget(item, widget)
+            display_names[prompt_type] = prompt_info.get("title", utils.format_display_name(prompt_type))
+        return display_names
+        
+    def _createPromptItem(self, prompt_type, display_name):
+        """Create the list item for a prompt type"""
+        item = QListWidgetItem(display_name)
+        item.setData(PROMPT_TYPE_ROLE, prompt_type)
+        return item
+        
+    def _searchKey(self, prompt_type, display_name):
+        """Return the lowercased search key filterPrompts matches against"""
+        return f"{prompt_type.lower()}\0{display_name.lower()}"
         
     def showMetadataDialog(self, prompt_type):
         """Show dialog to view/edit prompt metadata"""
         dialog = MetadataDialog(prompt_type, self.prompt_library, parent=self)
         if dialog.exec():
             # Refresh the prompt list to show any updates
-            self.populatePromptList()
+            self.refreshPromptList()
             
     def updateUrgencyDisplay(self, value):
         """Update the urgency level display"""
         self.urgency_display.setText(URGENCY_LEVELS.get(value, f"Level {value}/10"))
             
-    def handleItemSelection(self, item):
-        """Handle item selection in the prompt list"""
-        # We removed the brief description, so this method now just
-        # handles the selection of an item in the prompt list
-        pass
-        
     def handleResize(self):
         """Handle window resize events"""
         # Adjust UI elements based on window size
         pass
         
     def resizeEvent(self, event):
-        """Override resize event to emit a custom signal"""
+        """Override resize event to emit a custom signal once resizing pauses"""
         super().resizeEvent(event)
-        self.resized.emit()
+        self._resize_timer.start()
         
     def createMenuBar(self):
         """Create the menu bar with all menu items"""
@@ -363,13 +444,13 @@ class PrometheusPromptGenerator(QMainWindow):
         file_menu = menu_bar.addMenu("&File")
         
         # Import/Export prompts
-        import_action = QAction("Import Prompts...", self)
-        import_action.triggered.connect(self.importPrompts)
-        file_menu.addAction(import_action)
+        self.import_action = QAction("Import Prompts...", self)
+        self.import_action.triggered.connect(self.importPrompts)
+        file_menu.addAction(self.import_action)
         
-        export_action = QAction("Export Prompts...", self)
-        export_action.triggered.connect(self.exportPrompts)
-        file_menu.addAction(export_action)
+        self.export_action = QAction("Export Prompts...", self)
+        self.export_action.triggered.connect(self.exportPrompts)
+        file_menu.addAction(self.export_action)
         
         file_menu.addSeparator()
         
@@ -391,32 +472,12 @@ class PrometheusPromptGenerator(QMainWindow):
         reset_font_action.triggered.connect(self.resetFontToDefault)
         edit_menu.addAction(reset_font_action)
         
-        # Theme submenu
+        # Theme submenu; the theme actions are built the first time it opens
         theme_menu = edit_menu.addMenu("Theme")
-        theme_group = QActionGroup(self)
-        theme_group.setExclusive(True)
-        
-        # Dark themes
-        dark_menu = theme_menu.addMenu("Dark Themes")
-        for theme_name in sorted([name for name in AVAILABLE_THEMES.keys() if name.startswith("Dark")]):
-            theme_action = QAction(theme_name, self)
-            theme_action.setCheckable(True)
-            if theme_name == self.current_theme:
-                theme_action.setChecked(True)
-            theme_action.triggered.connect(lambda checked, name=theme_name: self.applyTheme(name))
-            dark_menu.addAction(theme_action)
-            theme_group.addAction(theme_action)
-            
-        # Light themes
-        light_menu = theme_menu.addMenu("Light Themes")
-        for theme_name in sorted([name for name in AVAILABLE_THEMES.keys() if name.startswith("Light")]):
-            theme_action = QAction(theme_name, self)
-            theme_action.setCheckable(True)
-            if theme_name == self.current_theme:
-                theme_action.setChecked(True)
-            theme_action.triggered.connect(lambda checked, name=theme_name: self.applyTheme(name))
-            light_menu.addAction(theme_action)
-            theme_group.addAction(theme_action)
+        self._dark_theme_menu = theme_menu.addMenu("Dark Themes")
+        self._light_theme_menu = theme_menu.addMenu("Light Themes")
+        self._themes_built = False
+        theme_menu.aboutToShow.connect(self._buildThemeActions)
         
         # Help menu
         help_menu = menu_bar.addMenu("&Help")
@@ -426,6 +487,32 @@ class PrometheusPromptGenerator(QMainWindow):
         about_action.triggered.connect(self.showAbout)
         help_menu.addAction(about_action)
     
+    def _buildThemeActions(self):
+        """Fill the Dark and Light theme submenus the first time the Theme menu opens"""
+        if self._themes_built:
+            return
+        self._themes_built = True
+        
+        # One connection for every theme action; each action carries its theme name
+        theme_group = QActionGroup(self)
+        theme_group.setExclusive(True)
+        theme_group.triggered.connect(self._onThemeActionTriggered)
+        
+        for menu, theme_names in ((self._dark_theme_menu, DARK_THEMES),
+                                  (self._light_theme_menu, LIGHT_THEMES)):
+            for theme_name in theme_names:
+                theme_action = QAction(theme_name, self)
+                theme_action.setCheckable(True)
+                theme_action.setData(theme_name)
+                if theme_name == self.current_theme:
+                    theme_action.setChecked(True)
+                menu.addAction(theme_action)
+                theme_group.addAction(theme_action)
+    
+    def _onThemeActionTriggered(self, action):
+        """Apply the theme of the triggered theme menu action"""
+        self.applyTheme(action.data())
+    
     def changeFont(self):
         """Open a dialog to change the application font"""
         current_font = QFont(self.font_family, self.font_size)
@@ -436,8 +523,8 @@ class PrometheusPromptGenerator(QMainWindow):
             self.font_size = font.pointSize()
             
             # Save to settings
-            self.settings.setValue("font_family", self.font_family)
-            self.settings.setValue("font_size", self.font_size)
+            self.saveSetting("font_family", self.font_family)
+            self.saveSetting("font_size", self.font_size)
             
             # Apply the new font
             self.applyFontSettings()
@@ -451,8 +538,8 @@ class PrometheusPromptGenerator(QMainWindow):
         self.font_size = DEFAULT_FONT_SIZE
         
         # Save to settings
-        self.settings.setValue("font_family", self.font_family)
-        self.settings.setValue("font_size", self.font_size)
+        self.saveSetting("font_family", self.font_family)
+        self.saveSetting("font_size", self.font_size)
         
         # Apply the new font
         self.applyFontSettings()
@@ -460,27 +547,65 @@ class PrometheusPromptGenerator(QMainWindow):
         self.statusBar().showMessage("Font reset to default", 3000)
         
     def refreshPromptList(self):
-        """Refresh the list of prompt types"""
+        """Refresh the list of prompt types, touching only rows that changed"""
         # Store the current filter text
         current_filter = self.filter_input.text()
         
-        # Re-populate the list
-        self.populatePromptList()
+        # Diff the library against the rows on display
+        new_names = self.getDisplayNames()
+        old_names = self._display_names
+        removed = [t for t in old_names if t not in new_names]
+        added = sorted(t for t in new_names if t not in old_names)
+        changed = [t for t in new_names if t in old_names and new_names[t] != old_names[t]]
+        
+        prompt_list = self.prompt_list
+        row_types = self._row_types
+        search_keys = self._search_keys
+        prompt_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(prompt_list):
+                for prompt_type in removed:
+                    row = bisect_left(row_types, prompt_type)
+                    prompt_list.takeItem(row)
+                    del row_types[row]
+                    del search_keys[row]
+                
+                for prompt_type in added:
+                    display_name = new_names[prompt_type]
+                    row = bisect_left(row_types, prompt_type)
+                    prompt_list.insertItem(row, self._createPromptItem(prompt_type, display_name))
+                    row_types.insert(row, prompt_type)
+                    search_keys.insert(row, self._searchKey(prompt_type, display_name))
+                
+                for prompt_type in changed:
+                    display_name = new_names[prompt_type]
+                    row = bisect_left(row_types, prompt_type)
+                    prompt_list.item(row).setText(display_name)
+                    search_keys[row] = self._searchKey(prompt_type, display_name)
+        finally:
+            prompt_list.setUpdatesEnabled(True)
+        
+        self._display_names = new_names
         
         # Re-apply the filter
         if current_filter:
             self.filterPrompts(current_filter)
             
+    def scheduleFilter(self, text):
+        """Restart the filter debounce timer after a change to the search text"""
+        self._filter_timer.start()
+        
+    def applyFilter(self):
+        """Filter the prompt list with the current search text"""
+        self.filterPrompts(self.filter_input.text())
+        
     def filterPrompts(self, text):
         """Filter the prompt list based on search text"""
-        for index in range(self.prompt_list.count()):
-            item = self.prompt_list.item(index)
-            widget = self.prompt_list.itemWidget(item)
-            
-            if text.lower() in widget.prompt_type.lower() or text.lower() in widget.display_name.lower():
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
+        # Search keys are lowercased once in populatePromptList
+        needle = text.lower()
+        item = self.prompt_list.item
+        for index, search_key in enumerate(self._search_keys):
+            item(index).setHidden(needle not in search_key)
                 
     def selectAllPrompts(self):
         """Select all prompt types in the list"""
@@ -505,30 +630,20 @@ class PrometheusPromptGenerator(QMainWindow):
         # Get urgency level
         urgency_level = self.urgency_slider.value()
         
-        # Generate prompts
-        generated_prompts = []
+        # Collect the non-empty templates in a single pass
+        get_prompt = self.prompt_library.get
+        templates = [
+            template for template in
+            (get_prompt(item.data(PROMPT_TYPE_ROLE)).get("template", "") for item in selected_items)
+            if template
+        ]
         
-        for item in selected_items:
-            widget = self.prompt_list.itemWidget(item)
-            prompt_type = widget.prompt_type
-            
-            # Get prompt template
-            prompt_data = self.prompt_library.get(prompt_type)
-            template = prompt_data.get("template", "")
-            
-            if template:
-                # Generate with urgency applied (clean output without metadata)
-                prompt_text = utils.generate_template_with_urgency(template, urgency_level)
-                
-                # Add to results (without metadata header)
-                generated_prompts.append(prompt_text)
-        
-        # Join all prompts with separator
-        separator = "\n\n" + "-" * 40 + "\n\n"
-        all_prompts = separator.join(generated_prompts)
+        # Generate with urgency applied (clean output without metadata), looking
+        # up the urgency modifiers once, and join with the separator
+        all_prompts = _SEPARATOR.join(utils.generate_templates_with_urgency(templates, urgency_level))
         
-        # Set the output text
-        self.output_text.setText(all_prompts)
+        # Set the output text; it is plain text, so skip rich-text detection
+        self.output_text.setPlainText(all_prompts)
         
         # Update status
         self.statusBar().showMessage(f"Generated {len(selected_items)} prompt(s) with urgency level {urgency_level}/10", 3000)
@@ -627,15 +742,38 @@ class PrometheusPromptGenerator(QMainWindow):
         # Add .json extension if not present
         if not file_path.endswith('.json'):
             file_path += '.json'
-            
+        
+        # Write the file on a worker thread; _onPromptsExported reports back
+        self.export_action.setEnabled(False)
+        # Deep copy, so the worker never reads prompt dicts the GUI thread may edit
+        prompts = copy.deepcopy(self.prompt_library.prompts)
+        QThreadPool.globalInstance().start(partial(self._writePromptsFile, file_path, prompts))
+        
+    def _writePromptsFile(self, file_path, prompts):
+        """Serialize prompts to a JSON file on a worker thread"""
         try:
-            # Export all prompts
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.prompt_library.prompts, f, indent=2)
-                
-            self.statusBar().showMessage(f"Exported {len(self.prompt_library.prompts)} prompts to {file_path}", 3000)
+                f.write(json_dumps(prompts))
+            result = (file_path, len(prompts))
         except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Error exporting prompts: {str(e)}")
+            result = e
+        
+        try:
+            self.promptsExported.emit(result)
+        except RuntimeError:
+            # The window was closed while the file was being written
+            pass
+            
+    def _onPromptsExported(self, result):
+        """Report the outcome of an export once the worker has finished"""
+        self.export_action.setEnabled(True)
+        
+        if isinstance(result, Exception):
+            QMessageBox.critical(self, "Export Error", f"Error exporting prompts: {str(result)}")
+            return
+        
+        file_path, export_count = result
+        self.statusBar().showMessage(f"Exported {export_count} prompts to {file_path}", 3000)
             
     def importPrompts(self):
         """Import prompts from a JSON file"""
@@ -644,11 +782,33 @@ class PrometheusPromptGenerator(QMainWindow):
         
         if not file_path:
             return
+        
+        # Read and parse the file on a worker thread; _onPromptsImported
+        # saves the prompts back on the GUI thread
+        self.import_action.setEnabled(False)
+        QThreadPool.globalInstance().start(partial(self._readPromptsFile, file_path))
+        
+    def _readPromptsFile(self, file_path):
+        """Read and parse a JSON prompts file on a worker thread"""
+        try:
+            with open(file_path, 'rb') as f:
+                result = json_loads(f.read())
+        except Exception as e:
+            result = e
+        
+        try:
+            self.promptsImported.emit(result)
+        except RuntimeError:
+            # The window was closed while the file was being read
+            pass
             
+    def _onPromptsImported(self, imported_prompts):
+        """Save parsed prompts to the library once the worker has finished"""
+        self.import_action.setEnabled(True)
+        
         try:
-            # Read the JSON file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                imported_prompts = json.load(f)
+            if isinstance(imported_prompts, Exception):
+                raise imported_prompts
                 
             # Validate the imported data
             if not isinstance(imported_prompts, dict):
@@ -698,24 +858,3 @@ class PrometheusPromptGenerator(QMainWindow):
             self.prompt_library.delete_prompt(prompt_type)
             self.refreshPromptList()
             self.statusBar().showMessage(f"Deleted prompt: {prompt_type}", 3000)
-        
-    def showMetadataDialog(self, prompt_type):
-        """Show dialog to view/edit prompt metadata"""
-        dialog = MetadataDialog(prompt_type, self.prompt_library, parent=self)
-        if dialog.exec():
-            # Refresh the prompt list to show any updates
-            self.populatePromptList()
-            
-    def updateUrgencyDisplay(self, value):
-        """Update the urgency level display"""
-        self.urgency_display.setText(URGENCY_LEVELS.get(value, f"Level {value}/10"))
-            
-    def handleResize(self):
-        """Handle window resize events"""
-        # Adjust UI elements based on window size
-        pass
-        
-    def resizeEvent(self, event):
-        """Override resize event to emit a custom signal"""
-        super().resizeEvent(event)
-        self.resized.emit() 
\ No newline at end of file
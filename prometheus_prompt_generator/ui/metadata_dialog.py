@@ -5,30 +5,31 @@ A dialog for viewing and editing prompt metadata.
 """
 
 import os
-import json
+import re
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QLabel, 
                            QLineEdit, QTextEdit, QDialogButtonBox, QMessageBox)
-from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
 
-from ..utils.constants import DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE, DEFAULT_VERSION, DEFAULT_CREATED_DATE, DEFAULT_UPDATED_DATE
+from ..utils.constants import get_default_font, DEFAULT_VERSION, DEFAULT_CREATED_DATE, DEFAULT_UPDATED_DATE
+
+# Splits a comma-separated tag list, consuming the whitespace around each comma
+_TAG_SPLIT = re.compile(r"\s*,\s*")
 
 class MetadataDialog(QDialog):
     """Dialog to display and edit prompt metadata"""
     
-    def __init__(self, prompt_type, prompt_info, parent=None):
+    def __init__(self, prompt_type=None, prompt_info=None, parent=None):
         """Initialize the metadata dialog.
         
         Args:
-            prompt_type (str): The type of prompt to edit
-            prompt_info (dict): Prompt information dictionary
+            prompt_type (str, optional): The type of prompt to edit. Defaults to None.
+            prompt_info (dict, optional): Prompt information dictionary. Defaults to None.
             parent (QWidget, optional): Parent widget. Defaults to None.
         """
         super().__init__(parent)
-        self.prompt_type = prompt_type
-        self.prompt_data = prompt_info
+        self.prompt_type = None
+        self.prompt_data = {}
         
-        self.setWindowTitle(f"Prompt Details: {prompt_type.replace('_', ' ').title()}")
         self.setMinimumWidth(500)  # Slightly wider for better readability
         
         # Main layout
@@ -39,49 +40,40 @@ class MetadataDialog(QDialog):
         form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
         form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
         
+        # Every field uses the same shared default font
+        default_font = get_default_font()
+        
         # Description
         self.description_edit = QTextEdit()
         self.description_edit.setPlaceholderText("Enter a description for this prompt")
-        self.description_edit.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE))
+        self.description_edit.setFont(default_font)
         self.description_edit.setMinimumHeight(100)
-        description = self.prompt_data.get("description", "")
-        self.description_edit.setText(description)
         form_layout.addRow("Description:", self.description_edit)
         
         # Tags
         self.tags_edit = QLineEdit()
         self.tags_edit.setPlaceholderText("Enter tags separated by commas")
-        self.tags_edit.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE))
-        metadata = self.prompt_data.get("metadata", {})
-        tags = metadata.get("tags", [])
-        if isinstance(tags, list):
-            self.tags_edit.setText(", ".join(tags))
-        else:
-            self.tags_edit.setText(str(tags))
+        self.tags_edit.setFont(default_font)
         form_layout.addRow("Tags:", self.tags_edit)
         
         # Author
         self.author_edit = QLineEdit()
-        self.author_edit.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE))
-        self.author_edit.setText(metadata.get("author", ""))
+        self.author_edit.setFont(default_font)
         form_layout.addRow("Author:", self.author_edit)
         
         # Version
         self.version_edit = QLineEdit()
-        self.version_edit.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE))
-        self.version_edit.setText(metadata.get("version", DEFAULT_VERSION))
+        self.version_edit.setFont(default_font)
         form_layout.addRow("Version:", self.version_edit)
         
         # Created date
         self.created_edit = QLineEdit()
-        self.created_edit.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE))
-        self.created_edit.setText(metadata.get("created", DEFAULT_CREATED_DATE))
+        self.created_edit.setFont(default_font)
         form_layout.addRow("Date Added:", self.created_edit)
         
         # Updated date
         self.updated_edit = QLineEdit()
-        self.updated_edit.setFont(QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE))
-        self.updated_edit.setText(metadata.get("updated", DEFAULT_UPDATED_DATE))
+        self.updated_edit.setFont(default_font)
         form_layout.addRow("Last Updated:", self.updated_edit)
         
         # Add form to main layout
@@ -93,6 +85,35 @@ class MetadataDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
         
+        if prompt_type is not None:
+            self.set_prompt(prompt_type, prompt_info)
+    
+    def set_prompt(self, prompt_type, prompt_info):
+        """Load a prompt into the dialog, so one dialog can be reused across prompts.
+        
+        Args:
+            prompt_type (str): The type of prompt to edit
+            prompt_info (dict): Prompt information dictionary
+        """
+        self.prompt_type = prompt_type
+        self.prompt_data = prompt_info if prompt_info is not None else {}
+        
+        self.setWindowTitle(f"Prompt Details: {prompt_type.replace('_', ' ').title()}")
+        
+        self.description_edit.setText(self.prompt_data.get("description", ""))
+        
+        metadata = self.prompt_data.get("metadata", {})
+        tags = metadata.get("tags", [])
+        if isinstance(tags, list):
+            self.tags_edit.setText(", ".join(tags))
+        else:
+            self.tags_edit.setText(str(tags))
+        
+        self.author_edit.setText(metadata.get("author", ""))
+        self.version_edit.setText(metadata.get("version", DEFAULT_VERSION))
+        self.created_edit.setText(metadata.get("created", DEFAULT_CREATED_DATE))
+        self.updated_edit.setText(metadata.get("updated", DEFAULT_UPDATED_DATE))
+        
     def accept(self):
         """Save the metadata changes"""
         # Update the description
@@ -103,7 +124,7 @@ class MetadataDialog(QDialog):
             self.prompt_data["metadata"] = {}
         
         # Update metadata fields
-        tags = [tag.strip() for tag in self.tags_edit.text().split(",") if tag.strip()]
+        tags = [tag for tag in _TAG_SPLIT.split(self.tags_edit.text().strip()) if tag]
         self.prompt_data["metadata"]["tags"] = tags
         self.prompt_data["metadata"]["author"] = self.author_edit.text()
         self.prompt_data["metadata"]["version"] = self.version_edit.text()
@@ -0,0 +1,145 @@
+"""
+Prometheus AI Prompt Item Delegate
+
+An item delegate that paints prompt rows directly from model data, so the
+prompt list needs no per-row widgets.
+"""
+
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem, QToolTip
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QRect, QSize
+
+# Item data role holding the prompt library key for a row
+PROMPT_TYPE_ROLE = Qt.ItemDataRole.UserRole
+
+# Row geometry, matching the layout of the PromptListItem widget
+_MARGIN = 5
+_SPACING = 5
+_TAG_WIDTH = 90
+_ICON_SIZE = 20
+_MIN_ROW_HEIGHT = 28
+
+# Mouse events handled on the info icon; the double click is the second press
+_ICON_CLICK_EVENTS = (
+    QEvent.Type.MouseButtonPress,
+    QEvent.Type.MouseButtonRelease,
+    QEvent.Type.MouseButtonDblClick,
+)
+
+
+class PromptItemDelegate(QStyledItemDelegate):
+    """Delegate that renders a prompt's name, type tag and info icon"""
+
+    info_clicked = pyqtSignal(str)  # Emits the prompt_type of the clicked row
+
+    def __init__(self, parent=None):
+        """Initialize the prompt item delegate.
+
+        Args:
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.tag_color = QColor("#2980b9")
+        self.info_icon = None
+
+    def setAccentColor(self, accent_color):
+        """Set the color used for the type tag.
+
+        Args:
+            accent_color (QColor or str): The accent color of the current theme
+        """
+        self.tag_color = QColor(accent_color)
+
+    def _layout(self, rect):
+        """Split a row rectangle into name, tag and info icon rectangles."""
+        inner = rect.adjusted(_MARGIN, 2, -_MARGIN, -2)
+        icon_rect = QRect(0, 0, _ICON_SIZE, _ICON_SIZE)
+        icon_rect.moveCenter(inner.center())
+        icon_rect.moveRight(inner.right())
+        tag_rect = QRect(icon_rect.left() - _SPACING - _TAG_WIDTH, inner.top(), _TAG_WIDTH, inner.height())
+        name_rect = QRect(inner.left(), inner.top(), tag_rect.left() - _SPACING - inner.left(), inner.height())
+        return name_rect, tag_rect, icon_rect
+
+    def paint(self, painter, option, index):
+        """Paint a prompt row"""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+
+        # Let the style draw the background, selection and focus; the text is drawn below
+        display_name = opt.text
+        opt.text = ""
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        name_rect, tag_rect, icon_rect = self._layout(opt.rect)
+        prompt_type = index.data(PROMPT_TYPE_ROLE)
+        if prompt_type is None:
+            # Placeholder row (e.g. while loading): the name spans the whole row
+            name_rect = opt.rect.adjusted(_MARGIN, 2, -_MARGIN, -2)
+
+        painter.save()
+
+        # Name
+        if opt.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(opt.palette.color(QPalette.ColorRole.HighlightedText))
+        else:
+            painter.setPen(opt.palette.color(QPalette.ColorRole.Text))
+        elided_name = opt.fontMetrics.elidedText(display_name, Qt.TextElideMode.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, elided_name)
+
+        # Rows without a prompt type get no type tag or info icon
+        if prompt_type is None:
+            painter.restore()
+            return
+
+        # Type tag
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.tag_color)
+        painter.drawRoundedRect(tag_rect, 10, 10)
+        painter.setPen(QColor("white"))
+        elided_type = opt.fontMetrics.elidedText(prompt_type, Qt.TextElideMode.ElideRight, tag_rect.width() - 10)
+        painter.drawText(tag_rect, Qt.AlignmentFlag.AlignCenter, elided_type)
+
+        # Info icon
+        if self.info_icon is None:
+            self.info_icon = style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation)
+        self.info_icon.paint(painter, icon_rect)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        """Return the size hint for a prompt row"""
+        size = super().sizeHint(option, index)
+        return QSize(size.width() + _TAG_WIDTH + _ICON_SIZE + 2 * _SPACING, max(size.height(), _MIN_ROW_HEIGHT))
+
+    def editorEvent(self, event, model, option, index):
+        """Emit info_clicked when a left click lands on the info icon"""
+        event_type = event.type()
+        if (event_type in _ICON_CLICK_EVENTS
+                and event.button() == Qt.MouseButton.LeftButton
+                and index.data(PROMPT_TYPE_ROLE) is not None):
+            _, _, icon_rect = self._layout(option.rect)
+            if icon_rect.contains(event.position().toPoint()):
+                # The press is consumed too, so clicking the icon does not
+                # toggle the row in the multi-selection list
+                if event_type == QEvent.Type.MouseButtonRelease:
+                    self.info_clicked.emit(index.data(PROMPT_TYPE_ROLE))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        """Show the prompt type or info tooltip for the hovered part of the row"""
+        if event.type() == QEvent.Type.ToolTip and index.data(PROMPT_TYPE_ROLE) is not None:
+            _, tag_rect, icon_rect = self._layout(option.rect)
+            pos = event.pos()
+            if icon_rect.contains(pos):
+                text = "View metadata"
+            elif tag_rect.contains(pos):
+                text = f"Type: {index.data(PROMPT_TYPE_ROLE)}"
+            else:
+                text = index.data(Qt.ItemDataRole.DisplayRole)
+            QToolTip.showText(event.globalPos(), text, view)
+            return True
+        return super().helpEvent(event, view, option, index)
@@ -2,6 +2,9 @@
 Prometheus AI Prompt List Item
 
 A custom widget for displaying prompt items in a list widget.
+
+Legacy: neither main window uses this widget any more; prompt rows are
+painted by PromptItemDelegate. It is kept for prompt_generator_qt.py.
 """
 
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QSizePolicy, QToolButton
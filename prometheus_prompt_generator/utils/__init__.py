@@ -2,6 +2,26 @@
 Utility modules for the Prometheus AI Prompt Generator
 """
 
+# orjson is optional; when installed it serializes prompt data much faster
+# than the standard json module. Both paths emit 2-space indented, key-sorted,
+# non-ASCII-escaped text so saved files do not depend on which one ran.
+try:
+    import orjson
+
+    def json_dumps(obj):
+        """Serialize obj to an indented JSON string"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode("utf-8")
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def json_dumps(obj):
+        """Serialize obj to an indented JSON string"""
+        return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False)
+
+    json_loads = json.loads
+
 from .prompt_library import PromptLibrary
 from . import constants
 from . import utils
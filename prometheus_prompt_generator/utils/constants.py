@@ -4,22 +4,54 @@ Constants for the Prometheus AI Prompt Generator
 This module contains constants used throughout the application.
 """
 
-from PyQt6.QtGui import QColor
+from types import MappingProxyType
 
 # Default theme colors - more vibrant yet coordinated
-PROMETHEUS_BLUE = QColor(41, 128, 185)      # Vibrant blue
-PROMETHEUS_LIGHT_BLUE = QColor(52, 152, 219) # Lighter blue for UI elements
-PROMETHEUS_DARK = QColor(33, 37, 43)        # Rich dark background
-PROMETHEUS_LIGHT = QColor(240, 240, 245)    # Clean light background
-PROMETHEUS_ACCENT = QColor(52, 152, 219)    # Vibrant blue accent (default)
+PROMETHEUS_BLUE_RGB = (41, 128, 185)        # Vibrant blue
+PROMETHEUS_LIGHT_BLUE_RGB = (52, 152, 219)  # Lighter blue for UI elements
+PROMETHEUS_DARK_RGB = (33, 37, 43)          # Rich dark background
+PROMETHEUS_LIGHT_RGB = (240, 240, 245)      # Clean light background
+PROMETHEUS_ACCENT_RGB = (52, 152, 219)      # Vibrant blue accent (default)
+
+# QColor constants built on first access by __getattr__, so importing this
+# module does not need QtGui
+_LAZY_COLORS = MappingProxyType({
+    "PROMETHEUS_BLUE": PROMETHEUS_BLUE_RGB,
+    "PROMETHEUS_LIGHT_BLUE": PROMETHEUS_LIGHT_BLUE_RGB,
+    "PROMETHEUS_DARK": PROMETHEUS_DARK_RGB,
+    "PROMETHEUS_LIGHT": PROMETHEUS_LIGHT_RGB,
+    "PROMETHEUS_ACCENT": PROMETHEUS_ACCENT_RGB,
+})
+
+def __getattr__(name):
+    """Create a PROMETHEUS_* QColor the first time it is looked up."""
+    rgb = _LAZY_COLORS.get(name)
+    if rgb is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from PyQt6.QtGui import QColor
+    color = globals()[name] = QColor(*rgb)
+    return color
 
 # Default fonts
 DEFAULT_FONT_FAMILY = "Segoe UI"
 DEFAULT_FONT_SIZE = 10
 DEFAULT_HEADING_SIZE = 14
 
+_DEFAULT_FONT = None
+
+def get_default_font():
+    """Return the shared default QFont, created on first use.
+    
+    QFont is implicitly shared, so widgets can all be given this instance.
+    """
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        from PyQt6.QtGui import QFont
+        _DEFAULT_FONT = QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE)
+    return _DEFAULT_FONT
+
 # Available themes from qt-material
-AVAILABLE_THEMES = {
+AVAILABLE_THEMES = MappingProxyType({
     "Dark Blue": "dark_blue.xml",
     "Dark Teal": "dark_teal.xml",
     "Dark Amber": "dark_amber.xml", 
@@ -34,7 +66,11 @@ AVAILABLE_THEMES = {
     "Light Pink": "light_pink.xml",
     "Light Red": "light_red.xml",
     "Light Yellow": "light_yellow.xml",
-}
+})
+
+# Theme names split into dark and light variants, sorted for the theme menus
+DARK_THEMES = tuple(sorted(name for name in AVAILABLE_THEMES if name.startswith("Dark")))
+LIGHT_THEMES = tuple(sorted(name for name in AVAILABLE_THEMES if name.startswith("Light")))
 
 # Default metadata values
 DEFAULT_AUTHOR = "Prometheus AI"
@@ -44,7 +80,7 @@ DEFAULT_UPDATED_DATE = "2025-03-09"
 DEFAULT_TAGS = ["ai", "prompt"]
 
 # Urgency level definitions
-URGENCY_LEVELS = {
+URGENCY_LEVELS = MappingProxyType({
     1: "Very Low",
     2: "Low",
     3: "Moderate",
@@ -55,13 +91,17 @@ URGENCY_LEVELS = {
     8: "Very High",
     9: "Urgent",
     10: "Critical"
-}
+})
+
+# Older name for URGENCY_LEVELS, kept for scripts that still import it
+URGENCY_NAMES = URGENCY_LEVELS
 
 # Theme settings
 DEFAULT_THEMES = ["Light", "Dark Blue", "Dark Gray"]
 
-DEFAULT_THEME_COLORS = {
-    "Light": {
+# Theme color tables are shared read-only across the application
+DEFAULT_THEME_COLORS = MappingProxyType({
+    "Light": MappingProxyType({
         "background": "#f5f5f5",
         "text": "#333333",
         "menu_bg": "#e0e0e0",
@@ -82,8 +122,8 @@ DEFAULT_THEME_COLORS = {
         "header_text": "#333333",
         "statusbar_bg": "#e0e0e0",
         "statusbar_text": "#333333"
-    },
-    "Dark Blue": {
+    }),
+    "Dark Blue": MappingProxyType({
         "background": "#2c2c2c",
         "text": "#ffffff",
         "menu_bg": "#333333",
@@ -104,8 +144,8 @@ DEFAULT_THEME_COLORS = {
         "header_text": "#ffffff",
         "statusbar_bg": "#333333",
         "statusbar_text": "#ffffff"
-    },
-    "Dark Gray": {
+    }),
+    "Dark Gray": MappingProxyType({
         "background": "#2c2c2c",
         "text": "#ffffff",
         "menu_bg": "#333333",
@@ -126,5 +166,5 @@ DEFAULT_THEME_COLORS = {
         "header_text": "#ffffff",
         "statusbar_bg": "#333333",
         "statusbar_text": "#ffffff"
-    }
-} 
\ No newline at end of file
+    }),
+})
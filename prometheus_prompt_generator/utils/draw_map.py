@@ -1,7 +1,7 @@
 import os
 import pathlib
 from gitignore_parser import parse_gitignore
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 from html import escape
 import time
 import json
@@ -35,6 +35,12 @@ class ProjectMapper:
         '.gif': 'https://cdn-icons-png.flaticon.com/512/337/337936.png',
     }
 
+    # Directories never worth mapping; they are skipped while listing their
+    # parent, so nothing below them is stat'd, resolved or matched
+    IGNORED_DIR_NAMES = frozenset({
+        '.git', '__pycache__', 'venv', '.venv', 'node_modules', 'dist', 'build'
+    })
+
     def __init__(self, root_dir: str):
         self.root_dir = pathlib.Path(root_dir).resolve()
         self.gitignore_matcher = self._load_gitignore()
@@ -59,10 +65,7 @@ class ProjectMapper:
             except Exception as e:
                 print(f"Warning: Could not parse .gitignore: {e}")
 
-        default_ignores = {
-            '.git/', '__pycache__/', '*.pyc', '*.egg-info/',
-            'venv/', '.venv/', 'node_modules/', 'dist/', 'build/'
-        }
+        default_ignores = {f'{name}/' for name in self.IGNORED_DIR_NAMES} | {'*.pyc', '*.egg-info/'}
 
         original_matcher = matcher
 
@@ -109,17 +112,36 @@ class ProjectMapper:
 
         return self.gitignore_matcher(relative_path)
 
-    def _get_file_icon(self, path: pathlib.Path) -> str:
+    def _get_file_icon(self, path: pathlib.Path, is_dir: bool) -> str:
         """Get appropriate logo URL based on file extension."""
-        if path.is_dir():
+        if is_dir:
             return 'https://cdn-icons-png.flaticon.com/512/7153/715399.png'
         ext = path.suffix.lower()
         return self.FILE_ICONS.get(ext, 'https://cdn-icons-png.flaticon.com/512/1375/1375106.png')
 
-    def _generate_tree_data(self, path: pathlib.Path, parent_id: str = "#", visited: Set[pathlib.Path] = None) -> List[Dict]:
+    def _list_children(self, path: pathlib.Path) -> List[Tuple[pathlib.Path, bool]]:
+        """List a directory's children, directories first, with whether each is a directory.
+
+        os.scandir reports each entry's type from the directory listing itself, so
+        unlike Path.iterdir() plus is_dir() this needs no extra stat() per child.
+        Directories named in IGNORED_DIR_NAMES are left out entirely.
+        """
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                is_dir = entry.is_dir()
+                if is_dir and entry.name in self.IGNORED_DIR_NAMES:
+                    continue
+                entries.append((not is_dir, entry.name.lower(), entry.path))
+        entries.sort()
+        return [(pathlib.Path(entry_path), not is_file) for is_file, _, entry_path in entries]
+
+    def _generate_tree_data(self, path: pathlib.Path, parent_id: str = "#", visited: Set[pathlib.Path] = None, is_dir: bool = None) -> List[Dict]:
         """Generate JSON data for jsTree recursively."""
         if visited is None:
             visited = set()
+        if is_dir is None:
+            is_dir = path.is_dir()
 
         if self._should_ignore(path, visited):
             print(f"Path ignored: {path}")
@@ -127,10 +149,10 @@ class ProjectMapper:
 
         node_id = f"node-{hash(str(path))}"
         name = path.name
-        icon = self._get_file_icon(path)
+        icon = self._get_file_icon(path, is_dir)
 
         data = []
-        if path.is_dir():
+        if is_dir:
             node = {
                 "id": node_id,
                 "parent": parent_id,
@@ -141,9 +163,8 @@ class ProjectMapper:
                 "children": []
             }
             try:
-                children = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-                for child in children:
-                    child_data = self._generate_tree_data(child, node_id, visited)
+                for child, child_is_dir in self._list_children(path):
+                    child_data = self._generate_tree_data(child, node_id, visited, child_is_dir)
                     # Filter out invalid child data
                     if child_data:
                         valid_children = [child_node for child_node in child_data if child_node and isinstance(child_node, dict) and "id" in child_node]
@@ -171,10 +192,12 @@ class ProjectMapper:
 
         return data
 
-    def _generate_ai_readable_text(self, path: pathlib.Path, prefix: str = "", is_last: bool = True, visited: Set[pathlib.Path] = None) -> List[str]:
+    def _generate_ai_readable_text(self, path: pathlib.Path, prefix: str = "", is_last: bool = True, visited: Set[pathlib.Path] = None, is_dir: bool = None) -> List[str]:
         """Generate AI-readable text with [DIR] and [FILE] tags."""
         if visited is None:
             visited = set()
+        if is_dir is None:
+            is_dir = path.is_dir()
 
         lines = []
 
@@ -182,13 +205,13 @@ class ProjectMapper:
             return lines
 
         connector = "└── " if is_last else "├── "
-        if path.is_dir():
+        if is_dir:
             lines.append(f"{prefix}{connector}[DIR] {path.name}/")
             try:
-                children = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
+                children = self._list_children(path)
                 new_prefix = prefix + ("    " if is_last else "│   ")
-                for i, child in enumerate(children):
-                    lines.extend(self._generate_ai_readable_text(child, new_prefix, i == len(children) - 1, visited))
+                for i, (child, child_is_dir) in enumerate(children):
+                    lines.extend(self._generate_ai_readable_text(child, new_prefix, i == len(children) - 1, visited, child_is_dir))
             except PermissionError:
                 print(f"Permission denied for {path}")
         else:
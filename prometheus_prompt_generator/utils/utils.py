@@ -60,6 +60,18 @@ def is_dark_theme(theme_name):
     """
     return theme_name.startswith("Dark")
 
+# Primary color hex codes keyed by theme color name, shared by the Dark and
+# Light variants; kept as strings so importing this module builds no QColor
+_THEME_PRIMARY_COLORS = {
+    "Blue": "#2980b9",
+    "Teal": "#009688",
+    "Amber": "#ffc107",
+    "Purple": "#9c27b0",
+    "Pink": "#e91e63",
+    "Red": "#f44336",
+    "Yellow": "#ffeb3b",
+}
+
 def get_theme_color(theme_name):
     """Get the primary color for a theme based on its name.
     
@@ -69,24 +81,10 @@ def get_theme_color(theme_name):
     Returns:
         QColor: The primary color for the theme.
     """
-    # For demonstration, we'll use a fixed set of colors based on theme
-    if theme_name == "Dark Blue" or theme_name == "Light Blue":
-        return QColor("#2980b9")
-    elif theme_name == "Dark Teal" or theme_name == "Light Teal":
-        return QColor("#009688")
-    elif theme_name == "Dark Amber" or theme_name == "Light Amber":
-        return QColor("#ffc107")
-    elif theme_name == "Dark Purple" or theme_name == "Light Purple":
-        return QColor("#9c27b0")
-    elif theme_name == "Dark Pink" or theme_name == "Light Pink":
-        return QColor("#e91e63")
-    elif theme_name == "Dark Red" or theme_name == "Light Red":
-        return QColor("#f44336")
-    elif theme_name == "Dark Yellow" or theme_name == "Light Yellow":
-        return QColor("#ffeb3b")
-    else:
-        # Default to blue
-        return QColor("#2980b9")
+    # Look the color up by the part after "Dark "/"Light ", defaulting to blue
+    mode, _, color_name = theme_name.partition(" ")
+    color = _THEME_PRIMARY_COLORS.get(color_name) if mode in ("Dark", "Light") else None
+    return QColor(color or _THEME_PRIMARY_COLORS["Blue"])
 
 def set_palette_color(palette, role, color):
     """Set a color for a specific palette role.
@@ -98,6 +96,84 @@ def set_palette_color(palette, role, color):
     """
     palette.setColor(role, color)
 
+# Urgency modifiers applied to templates, keyed by urgency level (1-10 scale)
+_URGENCY_MODIFIERS = {
+    1: {
+        "intro": "Whenever you have free time, please consider",
+        "deadline": "There is absolutely no rush at all.",
+        "priority": "This is a very low priority task.",
+        "tone": "The tone should be extremely casual and relaxed."
+    },
+    2: {
+        "intro": "When you have time, please",
+        "deadline": "There is no rush.",
+        "priority": "This is a low priority task.",
+        "tone": "The tone should be casual and relaxed."
+    },
+    3: {
+        "intro": "I would appreciate if you could",
+        "deadline": "This can be completed at your convenience.",
+        "priority": "This is a below average priority task.",
+        "tone": "The tone should be friendly and unhurried."
+    },
+    4: {
+        "intro": "Please",
+        "deadline": "This should be completed within a reasonable timeframe.",
+        "priority": "This is a standard priority task.",
+        "tone": "The tone should be professional but not urgent."
+    },
+    5: {
+        "intro": "I would like you to",
+        "deadline": "This should be completed in a timely manner.",
+        "priority": "This is a moderately important task.",
+        "tone": "The tone should be clear and straightforward."
+    },
+    6: {
+        "intro": "I need you to",
+        "deadline": "This should be completed soon.",
+        "priority": "This is an important task.",
+        "tone": "The tone should be direct and focused."
+    },
+    7: {
+        "intro": "I strongly need you to",
+        "deadline": "This should be completed promptly.",
+        "priority": "This is a high priority task.",
+        "tone": "The tone should convey notable importance."
+    },
+    8: {
+        "intro": "I urgently need you to",
+        "deadline": "This needs to be completed quickly.",
+        "priority": "This is a very high priority task.",
+        "tone": "The tone should convey significant importance and urgency."
+    },
+    9: {
+        "intro": "URGENT: I require you to",
+        "deadline": "This requires immediate attention.",
+        "priority": "This is a critical priority task.",
+        "tone": "The tone should convey strong urgency and importance."
+    },
+    10: {
+        "intro": "CRITICAL URGENT ACTION REQUIRED:",
+        "deadline": "This demands immediate action.",
+        "priority": "This is the highest possible priority task.",
+        "tone": "The tone should convey maximum urgency and critical importance."
+    }
+}
+
+def _urgency_affixes(urgency_level):
+    """Build the intro and suffix text for an urgency level.
+    
+    Args:
+        urgency_level (int): Urgency level from 1 to 10.
+        
+    Returns:
+        tuple: The intro to prepend and the suffix to append to a template.
+    """
+    # Get modifiers for the specified urgency level (default to medium if out of range)
+    modifiers = _URGENCY_MODIFIERS.get(urgency_level, _URGENCY_MODIFIERS[5])
+    urgency_suffix = f"\n\n{modifiers['deadline']} {modifiers['priority']} {modifiers['tone']}"
+    return modifiers['intro'], urgency_suffix
+
 def generate_template_with_urgency(template, urgency_level):
     """Generate a prompt template with the specified urgency level applied.
     
@@ -108,79 +184,22 @@ def generate_template_with_urgency(template, urgency_level):
     Returns:
         str: The template with urgency applied.
     """
-    # Define urgency modifiers based on urgency level (1-10 scale)
-    urgency_modifiers = {
-        1: {
-            "intro": "Whenever you have free time, please consider",
-            "deadline": "There is absolutely no rush at all.",
-            "priority": "This is a very low priority task.",
-            "tone": "The tone should be extremely casual and relaxed."
-        },
-        2: {
-            "intro": "When you have time, please",
-            "deadline": "There is no rush.",
-            "priority": "This is a low priority task.",
-            "tone": "The tone should be casual and relaxed."
-        },
-        3: {
-            "intro": "I would appreciate if you could",
-            "deadline": "This can be completed at your convenience.",
-            "priority": "This is a below average priority task.",
-            "tone": "The tone should be friendly and unhurried."
-        },
-        4: {
-            "intro": "Please",
-            "deadline": "This should be completed within a reasonable timeframe.",
-            "priority": "This is a standard priority task.",
-            "tone": "The tone should be professional but not urgent."
-        },
-        5: {
-            "intro": "I would like you to",
-            "deadline": "This should be completed in a timely manner.",
-            "priority": "This is a moderately important task.",
-            "tone": "The tone should be clear and straightforward."
-        },
-        6: {
-            "intro": "I need you to",
-            "deadline": "This should be completed soon.",
-            "priority": "This is an important task.",
-            "tone": "The tone should be direct and focused."
-        },
-        7: {
-            "intro": "I strongly need you to",
-            "deadline": "This should be completed promptly.",
-            "priority": "This is a high priority task.",
-            "tone": "The tone should convey notable importance."
-        },
-        8: {
-            "intro": "I urgently need you to",
-            "deadline": "This needs to be completed quickly.",
-            "priority": "This is a very high priority task.",
-            "tone": "The tone should convey significant importance and urgency."
-        },
-        9: {
-            "intro": "URGENT: I require you to",
-            "deadline": "This requires immediate attention.",
-            "priority": "This is a critical priority task.",
-            "tone": "The tone should convey strong urgency and importance."
-        },
-        10: {
-            "intro": "CRITICAL URGENT ACTION REQUIRED:",
-            "deadline": "This demands immediate action.",
-            "priority": "This is the highest possible priority task.",
-            "tone": "The tone should convey maximum urgency and critical importance."
-        }
-    }
-    
-    # Get modifiers for the specified urgency level (default to medium if out of range)
-    modifiers = urgency_modifiers.get(urgency_level, urgency_modifiers[5])
+    return generate_templates_with_urgency([template], urgency_level)[0]
+
+def generate_templates_with_urgency(templates, urgency_level):
+    """Generate several prompt templates with the same urgency level applied.
     
-    # Process any placeholders in the template (like {topic}, {language}, etc.)
-    # For now, we'll keep the placeholders as they are since we don't have values for them
-    processed_template = template
+    The urgency modifiers are looked up and formatted once for the whole batch.
     
-    # Add urgency to the template
-    urgency_prefix = f"{modifiers['intro']} {processed_template.lstrip()}\n\n"
-    urgency_suffix = f"\n\n{modifiers['deadline']} {modifiers['priority']} {modifiers['tone']}"
+    Args:
+        templates (list): The original prompt templates.
+        urgency_level (int): Urgency level from 1 to 10.
+        
+    Returns:
+        list: The templates with urgency applied, in the same order.
+    """
+    intro, urgency_suffix = _urgency_affixes(urgency_level)
     
-    return urgency_prefix + urgency_suffix 
\ No newline at end of file
+    # Placeholders in the templates (like {topic}, {language}, etc.) are kept
+    # as they are since we don't have values for them
+    return [f"{intro} {template.lstrip()}\n\n" + urgency_suffix for template in templates]
@@ -109,6 +109,9 @@ def generate_ui_file():
           <property name="alternatingRowColors">
            <bool>true</bool>
           </property>
+          <property name="selectionMode">
+           <enum>QAbstractItemView::MultiSelection</enum>
+          </property>
          </widget>
         </item>
         <item>
@@ -190,7 +193,10 @@ def generate_ui_file():
          </widget>
         </item>
         <item>
-         <widget class="QTextEdit" name="outputText">
+         <widget class="QPlainTextEdit" name="outputText">
+          <property name="maximumBlockCount">
+           <number>10000</number>
+          </property>
           <property name="placeholderText">
            <string>Generated prompt will appear here. You can edit it as needed.</string>
           </property>
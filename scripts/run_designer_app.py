@@ -37,7 +37,7 @@ try:
     print(f"Successfully converted UI file to Python: {UI_PY_FILE}")
 except (subprocess.CalledProcessError, FileNotFoundError) as e:
     print(f"Warning: Could not convert UI file: {e}")
-    print("Will try to use direct loading approach.")
+    print("Will use the existing compiled UI class.")
 
 # Now try to import the designer main window
 try:
@@ -58,7 +58,7 @@ class MainWindowComposition(QMainWindow):
     @pyqtSlot()
     def on_generate_prompts(self):
         """Handle generate prompts button click."""
-        self.ui.outputText.setText("Generated prompt example.\nThis is from the composition approach.")
+        self.ui.outputText.setPlainText("Generated prompt example.\nThis is from the composition approach.")
     
     @pyqtSlot()
     def on_copy_to_clipboard(self):
@@ -139,7 +139,7 @@ try:
         @pyqtSlot()
         def on_generate_prompts(self):
             """Handle generate prompts button click."""
-            self.outputText.setText("Generated prompt example.\nThis is from the inheritance approach.")
+            self.outputText.setPlainText("Generated prompt example.\nThis is from the inheritance approach.")
         
         @pyqtSlot()
         def on_copy_to_clipboard(self):